@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from logging.config import fileConfig
 
 from alembic import context
 from sqlalchemy.ext.asyncio import async_engine_from_config
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from easysql.config import get_settings
 from easysql_api.infrastructure.persistence.models import Base
@@ -18,6 +19,7 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+@functools.cache
 def _get_database_url() -> str:
     settings = get_settings()
     uri = settings.get_session_postgres_uri()
@@ -59,7 +61,11 @@ async def run_migrations_online() -> None:
     connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=NullPool,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        query_cache_size=1200,
     )
 
     async with connectable.connect() as connection:
@@ -1,4 +1,4 @@
-from easysql.code_context.chunker import ChunkResult, CodeChunk, CodeChunker
+from easysql.code_context.chunker import ChunkResult, ChunkTable, CodeChunk, CodeChunker
 from easysql.code_context.factory import CodeContextFactory
 from easysql.code_context.pipeline import CodeSyncPipeline, SyncResult
 from easysql.code_context.retrieval import (
@@ -15,6 +15,7 @@ from easysql.code_context.utils import FileChange, FileTracker, LanguageDetector
 
 __all__ = [
     "ChunkResult",
+    "ChunkTable",
     "CodeChunk",
     "CodeChunker",
     "CodeContextFactory",
@@ -7,12 +7,26 @@ for syntax-aware code chunking.
 
 from __future__ import annotations
 
+import re
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from pathlib import Path
+from itertools import islice
+from pathlib import Path, PurePath
 from typing import Any
 
 from easysql.utils.logger import get_logger
 
+try:
+    from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
+except ImportError as _import_error:  # pragma: no cover - depends on environment
+    Language = None  # type: ignore[assignment,misc]
+    RecursiveCharacterTextSplitter = None  # type: ignore[assignment,misc]
+    _SPLITTER_IMPORT_ERROR: ImportError | None = _import_error
+else:
+    _SPLITTER_IMPORT_ERROR = None
+
 logger = get_logger(__name__)
 
 # Language mapping: extension -> (langchain Language enum name, glob pattern)
@@ -28,8 +42,23 @@ LANGUAGE_CONFIG: dict[str, tuple[str, str]] = {
     "c": ("C", "**/*.c"),
 }
 
+# Stops at the first non-whitespace char instead of allocating a stripped copy
+_NON_WS = re.compile(r"\S")
+
+# Resolved langchain Language enum per language key; languages whose enum is
+# missing from the installed langchain version are left out
+_LANG_ENUMS: dict[str, Any] = (
+    {
+        key: Language.__members__[cfg[0]]
+        for key, cfg in LANGUAGE_CONFIG.items()
+        if cfg[0] in Language.__members__
+    }
+    if Language is not None
+    else {}
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class CodeChunk:
     """Represents a code chunk with metadata."""
 
@@ -39,20 +68,32 @@ class CodeChunk:
     language: str
     chunk_index: int = 0
     metadata: dict[str, Any] = field(default_factory=dict)
+    file_stem: str = field(default="", repr=False)
+    _chunk_id: str = field(init=False, default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.file_stem:
+            self.file_stem = Path(self.file_path).stem
+        self._chunk_id = f"{self.file_path}:{self.chunk_index}"
 
     @property
     def chunk_id(self) -> str:
-        """Generate unique ID for this chunk."""
-        return f"{self.file_path}:{self.chunk_index}"
+        """Unique ID for this chunk, computed once at construction."""
+        return self._chunk_id
+
+    def relocate(self, file_path: str) -> None:
+        """Point the chunk at a new file path, keeping chunk_id and file_stem in sync."""
+        self.file_path = file_path
+        self.file_stem = PurePath(file_path).stem
+        self._chunk_id = f"{file_path}:{self.chunk_index}"
 
     def to_embedding_text(self) -> str:
         """Generate text for embedding."""
         # Include file path context for better retrieval
-        file_name = Path(self.file_path).stem
-        return f"file:{file_name}\n{self.content}"
+        return f"file:{self.file_stem}\n{self.content}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkResult:
     """Result of chunking operation."""
 
@@ -68,6 +109,50 @@ class ChunkResult:
         return len(self.chunks)
 
 
+@dataclass(slots=True)
+class ChunkTable:
+    """Columnar (structure-of-arrays) view of code chunks.
+
+    Bulk consumers such as the Milvus writer read one attribute across all
+    chunks at a time, so parallel lists avoid touching every CodeChunk object.
+    """
+
+    chunk_ids: list[str] = field(default_factory=list)
+    contents: list[str] = field(default_factory=list)
+    file_paths: list[str] = field(default_factory=list)
+    file_hashes: list[str] = field(default_factory=list)
+    languages: list[str] = field(default_factory=list)
+    chunk_indices: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_chunks(cls, chunks: list[CodeChunk]) -> ChunkTable:
+        table = cls()
+        table.extend(chunks)
+        return table
+
+    def extend(self, chunks: list[CodeChunk]) -> None:
+        self.chunk_ids.extend(c.chunk_id for c in chunks)
+        self.contents.extend(c.content for c in chunks)
+        self.file_paths.extend(c.file_path for c in chunks)
+        self.file_hashes.extend(c.file_hash for c in chunks)
+        self.languages.extend(c.language for c in chunks)
+        self.chunk_indices.extend(c.chunk_index for c in chunks)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    def embedding_texts(self) -> list[str]:
+        """Same text as CodeChunk.to_embedding_text, computing each file stem once."""
+        stems: dict[str, str] = {}
+        texts: list[str] = []
+        for path, content in zip(self.file_paths, self.contents, strict=True):
+            stem = stems.get(path)
+            if stem is None:
+                stem = stems[path] = Path(path).stem
+            texts.append(f"file:{stem}\n{content}")
+        return texts
+
+
 class CodeChunker:
     """
     LangChain-based code chunker.
@@ -81,6 +166,8 @@ class CodeChunker:
         chunk_size: int = 2000,
         chunk_overlap: int = 200,
         supported_languages: list[str] | None = None,
+        max_workers: int = 4,
+        use_processes: bool = False,
     ):
         """
         Initialize the code chunker.
@@ -89,47 +176,51 @@ class CodeChunker:
             chunk_size: Maximum size of each chunk in characters.
             chunk_overlap: Overlap between adjacent chunks.
             supported_languages: List of supported languages. Defaults to all.
+            max_workers: Worker pool size used by chunk_files. 1 disables parallelism.
+            use_processes: Split files in worker processes instead of threads, for
+                CPU-bound splitting of large repositories.
         """
         self._chunk_size = chunk_size
         self._chunk_overlap = chunk_overlap
+        self._max_workers = max(1, max_workers)
+        self._use_processes = use_processes
         self._supported_languages = (
             set(supported_languages) if supported_languages else set(LANGUAGE_CONFIG.keys())
         )
-        self._splitters: dict[str, Any] = {}
+        self._generic_splitter, self._splitters = self._build_splitters()
+
+    def _build_splitters(self) -> tuple[Any, dict[str, Any]]:
+        """Build the generic splitter and one splitter per supported language.
+
+        Splitters are created up front and never mutated afterwards, so they
+        can be shared safely by chunk_files worker threads.
+        """
+        if _SPLITTER_IMPORT_ERROR is not None:
+            logger.warning(f"langchain_text_splitters not available: {_SPLITTER_IMPORT_ERROR}")
+            return None, {}
+
+        generic = RecursiveCharacterTextSplitter(
+            chunk_size=self._chunk_size,
+            chunk_overlap=self._chunk_overlap,
+        )
+
+        splitters: dict[str, Any] = {}
+        for language in self._supported_languages:
+            lang_enum = _LANG_ENUMS.get(language)
+            if lang_enum is not None:
+                splitters[language] = RecursiveCharacterTextSplitter.from_language(
+                    language=lang_enum,
+                    chunk_size=self._chunk_size,
+                    chunk_overlap=self._chunk_overlap,
+                )
+            else:
+                splitters[language] = generic
+
+        return generic, splitters
 
     def _get_splitter(self, language: str) -> Any:
-        """Get or create a text splitter for the given language."""
-        if language not in self._splitters:
-            try:
-                from langchain_text_splitters import Language, RecursiveCharacterTextSplitter
-
-                lang_config = LANGUAGE_CONFIG.get(language)
-                if not lang_config:
-                    # Fallback to generic splitter
-                    self._splitters[language] = RecursiveCharacterTextSplitter(
-                        chunk_size=self._chunk_size,
-                        chunk_overlap=self._chunk_overlap,
-                    )
-                else:
-                    lang_enum_name = lang_config[0]
-                    lang_enum = getattr(Language, lang_enum_name, None)
-                    if lang_enum:
-                        self._splitters[language] = RecursiveCharacterTextSplitter.from_language(
-                            language=lang_enum,
-                            chunk_size=self._chunk_size,
-                            chunk_overlap=self._chunk_overlap,
-                        )
-                    else:
-                        self._splitters[language] = RecursiveCharacterTextSplitter(
-                            chunk_size=self._chunk_size,
-                            chunk_overlap=self._chunk_overlap,
-                        )
-            except ImportError as e:
-                logger.warning(f"langchain_text_splitters not available: {e}")
-                # Return a simple fallback
-                self._splitters[language] = None
-
-        return self._splitters.get(language)
+        """Get the text splitter for the given language."""
+        return self._splitters.get(language, self._generic_splitter)
 
     def chunk_file(
         self,
@@ -143,67 +234,85 @@ class CodeChunker:
         Args:
             file_path: Path to the file.
             language: Programming language of the file.
-            file_hash: MD5 hash of the file content.
+            file_hash: Content hash of the file.
 
         Returns:
             ChunkResult with chunks and any errors.
         """
-        chunks: list[CodeChunk] = []
-        errors: list[str] = []
-
         try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
+            raw = file_path.read_bytes()
         except OSError as e:
             return ChunkResult(errors=[f"Failed to read file {file_path}: {e}"])
 
-        if not content.strip():
+        return self.chunk_bytes(raw, str(file_path), language, file_hash)
+
+    def chunk_bytes(
+        self,
+        raw: bytes,
+        file_path: str,
+        language: str,
+        file_hash: str,
+    ) -> ChunkResult:
+        """
+        Chunk file content that is already in memory.
+
+        Args:
+            raw: Raw file bytes (decoded as UTF-8).
+            file_path: Path recorded on the chunks.
+            language: Programming language of the file.
+            file_hash: Content hash of the file.
+
+        Returns:
+            ChunkResult with chunks and any errors.
+        """
+        chunks: list[CodeChunk] = []
+        errors: list[str] = []
+
+        # Every chunk of this file shares the same path/hash/language objects
+        path_str = sys.intern(file_path)
+        file_stem = PurePath(file_path).stem
+        file_hash = sys.intern(file_hash)
+        language = sys.intern(language)
+
+        # Check emptiness on raw bytes so whitespace-only files are never decoded
+        if not raw.strip():
             return ChunkResult()
 
+        content = raw.decode("utf-8", errors="replace")
+
         splitter = self._get_splitter(language)
 
         if splitter is None:
-            # Fallback: treat whole file as one chunk
-            chunks.append(
-                CodeChunk(
-                    content=content[: self._chunk_size],
-                    file_path=str(file_path),
-                    file_hash=file_hash,
-                    language=language,
-                    chunk_index=0,
-                )
-            )
+            # Fallback: fixed-size windows over the whole file
+            text_chunks = self._simple_chunks(content)
         else:
             try:
                 text_chunks = splitter.split_text(content)
-                for i, chunk_text in enumerate(text_chunks):
-                    if chunk_text.strip():
-                        chunks.append(
-                            CodeChunk(
-                                content=chunk_text,
-                                file_path=str(file_path),
-                                file_hash=file_hash,
-                                language=language,
-                                chunk_index=i,
-                            )
-                        )
             except Exception as e:
                 errors.append(f"Failed to split {file_path}: {e}")
-                # Fallback to simple chunking
-                for i in range(0, len(content), self._chunk_size - self._chunk_overlap):
-                    chunk_text = content[i : i + self._chunk_size]
-                    if chunk_text.strip():
-                        chunks.append(
-                            CodeChunk(
-                                content=chunk_text,
-                                file_path=str(file_path),
-                                file_hash=file_hash,
-                                language=language,
-                                chunk_index=i // (self._chunk_size - self._chunk_overlap),
-                            )
-                        )
+                text_chunks = self._simple_chunks(content)
+
+        chunks.extend(
+            CodeChunk(
+                content=chunk_text,
+                file_path=path_str,
+                file_hash=file_hash,
+                language=language,
+                chunk_index=index,
+                file_stem=file_stem,
+            )
+            for index, chunk_text in enumerate(text_chunks)
+            if _NON_WS.search(chunk_text)
+        )
 
         return ChunkResult(chunks=chunks, errors=errors)
 
+    def _simple_chunks(self, content: str) -> list[str]:
+        """Split content into overlapping fixed-size windows covering the whole text."""
+        size = self._chunk_size
+        step = max(1, size - self._chunk_overlap)
+        return [content[start : start + size] for start in range(0, len(content), step)]
+
     def chunk_files(
         self,
         files: list[tuple[Path, str, str]],
@@ -220,16 +329,171 @@ class CodeChunker:
         all_chunks: list[CodeChunk] = []
         all_errors: list[str] = []
 
-        for file_path, language, file_hash in files:
+        all_chunks.extend(self.iter_chunk_files(files, errors=all_errors))
+
+        return ChunkResult(chunks=all_chunks, errors=all_errors)
+
+    def iter_chunk_files(
+        self,
+        files: list[tuple[Path, str, str]],
+        errors: list[str] | None = None,
+    ) -> Iterator[CodeChunk]:
+        """
+        Lazily chunk multiple files, yielding chunks one file at a time.
+
+        Only a bounded window of files is chunked ahead of the consumer, so
+        peak memory stays flat no matter how large the repository is.
+
+        Args:
+            files: List of (file_path, language, file_hash) tuples.
+            errors: Optional list that receives per-file error messages.
+
+        Yields:
+            CodeChunk objects in input file order.
+        """
+        for result in self._iter_results(files):
+            if errors is not None:
+                errors.extend(result.errors)
+            yield from result.chunks
+
+    def chunk_files_from_bytes(
+        self,
+        files: Iterable[tuple[str, str, str, bytes]],
+    ) -> ChunkResult:
+        """
+        Chunk multiple in-memory files.
+
+        Args:
+            files: (file_path, language, file_hash, content) tuples. May be a
+                generator so contents are only held one file at a time.
+
+        Returns:
+            Combined ChunkResult.
+        """
+        all_chunks: list[CodeChunk] = []
+        all_errors: list[str] = []
+
+        for file_path, language, file_hash, raw in files:
             if language not in self._supported_languages:
                 continue
-
-            result = self.chunk_file(file_path, language, file_hash)
+            result = self.chunk_bytes(raw, file_path, language, file_hash)
             all_chunks.extend(result.chunks)
             all_errors.extend(result.errors)
 
         return ChunkResult(chunks=all_chunks, errors=all_errors)
 
+    def chunk_files_columnar(
+        self,
+        files: list[tuple[Path, str, str]],
+    ) -> tuple[ChunkTable, list[str]]:
+        """
+        Chunk multiple files straight into a columnar ChunkTable.
+
+        Args:
+            files: List of (file_path, language, file_hash) tuples.
+
+        Returns:
+            Tuple of (ChunkTable, errors).
+        """
+        table = ChunkTable()
+        errors: list[str] = []
+
+        for result in self._iter_results(files):
+            table.extend(result.chunks)
+            errors.extend(result.errors)
+
+        return table, errors
+
+    def _iter_results(self, files: list[tuple[Path, str, str]]) -> Iterator[ChunkResult]:
+        """Chunk every supported file, yielding results in input order."""
+        supported = [f for f in files if f[1] in self._supported_languages]
+
+        if self._max_workers == 1 or len(supported) <= 1:
+            for f in supported:
+                yield self.chunk_file(*f)
+            return
+
+        workers = min(self._max_workers, len(supported))
+
+        if self._use_processes:
+            # Size balancing needs the whole file list up front
+            yield from self._chunk_in_processes(supported, workers)
+            return
+
+        pending = iter(supported)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while window := list(islice(pending, workers * 4)):
+                yield from executor.map(lambda f: self.chunk_file(*f), window)
+
+    def _chunk_in_processes(
+        self,
+        files: list[tuple[Path, str, str]],
+        workers: int,
+    ) -> list[ChunkResult]:
+        """Chunk files in a process pool, one size-balanced partition per worker."""
+        partitions = _partition_by_size(files, workers)
+        results: list[ChunkResult | None] = [None] * len(files)
+
+        with ProcessPoolExecutor(
+            max_workers=len(partitions),
+            initializer=_init_worker_chunker,
+            initargs=(self._chunk_size, self._chunk_overlap, sorted(self._supported_languages)),
+        ) as executor:
+            for partition_results in executor.map(_chunk_partition, partitions):
+                for index, result in partition_results:
+                    results[index] = result
+
+        return [r for r in results if r is not None]
+
     @property
     def supported_languages(self) -> set[str]:
         return self._supported_languages
+
+
+# Per-process chunker used by CodeChunker(use_processes=True) workers
+_worker_chunker: CodeChunker | None = None
+
+
+def _init_worker_chunker(
+    chunk_size: int,
+    chunk_overlap: int,
+    supported_languages: list[str],
+) -> None:
+    global _worker_chunker
+    _worker_chunker = CodeChunker(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        supported_languages=supported_languages,
+        max_workers=1,
+    )
+
+
+def _chunk_partition(
+    partition: list[tuple[int, tuple[Path, str, str]]],
+) -> list[tuple[int, ChunkResult]]:
+    assert _worker_chunker is not None
+    return [(index, _worker_chunker.chunk_file(*f)) for index, f in partition]
+
+
+def _partition_by_size(
+    files: list[tuple[Path, str, str]],
+    parts: int,
+) -> list[list[tuple[int, tuple[Path, str, str]]]]:
+    """Greedily spread files over parts so each gets roughly equal total bytes."""
+
+    def _size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    sizes = [_size(f[0]) for f in files]
+    buckets: list[list[tuple[int, tuple[Path, str, str]]]] = [[] for _ in range(parts)]
+    loads = [0] * parts
+
+    for index in sorted(range(len(files)), key=sizes.__getitem__, reverse=True):
+        target = loads.index(min(loads))
+        buckets[target].append((index, files[index]))
+        loads[target] += sizes[index]
+
+    return [b for b in buckets if b]
@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
-import hashlib
 import shutil
 import tempfile
+import zipfile
+from collections.abc import Callable
+from contextlib import ExitStack
 from dataclasses import dataclass, field
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING, Any
 
 from easysql.utils.logger import get_logger
 
 if TYPE_CHECKING:
-    from easysql.code_context.chunker import CodeChunker
-    from easysql.code_context.storage.milvus_writer import CodeMilvusWriter
-    from easysql.code_context.utils.file_utils import FileTracker, LanguageDetector
+    from easysql.code_context.chunker import ChunkResult, CodeChunker
+    from easysql.code_context.storage.milvus_writer import CodeMilvusWriter, WriteMode
+    from easysql.code_context.utils.file_utils import FileChange, FileTracker, LanguageDetector
 
 logger = get_logger(__name__)
 
+# Archive members above this size are hashed and chunked from a temp file
+MAX_IN_MEMORY_MEMBER_SIZE = 8 * 1024 * 1024
+
 
 @dataclass
 class SyncResult:
@@ -70,10 +75,6 @@ class CodeSyncPipeline:
             )
         return self._detector
 
-    def _compute_hash(self, file_path: Path) -> str:
-        content = file_path.read_bytes()
-        return hashlib.md5(content).hexdigest()
-
     def sync_from_zip(
         self,
         zip_path: Path | str,
@@ -87,6 +88,16 @@ class CodeSyncPipeline:
                 errors=[f"ZIP file not found: {zip_path}"],
             )
 
+        if zipfile.is_zipfile(zip_path):
+            try:
+                return self._sync_from_zipfile(zip_path, project_id)
+            except (zipfile.BadZipFile, OSError) as e:
+                return SyncResult(
+                    project_id=project_id,
+                    errors=[f"Failed to extract ZIP: {e}"],
+                )
+
+        # Other archive formats: unpack to disk and scan
         with tempfile.TemporaryDirectory() as temp_dir:
             extract_path = Path(temp_dir)
 
@@ -107,6 +118,95 @@ class CodeSyncPipeline:
                 project_id=project_id,
             )
 
+    def _select_zip_members(
+        self,
+        zf: zipfile.ZipFile,
+        project_id: str,
+    ) -> dict[str, tuple[zipfile.ZipInfo, str]]:
+        """Map project-relative paths to the archive members worth processing.
+
+        A single top-level directory is treated as the project root, the same
+        way sync_from_zip does for unpacked archives. Every member counts when
+        looking for it, not only the files that will be processed.
+        """
+        detector = self._get_detector()
+        kept: list[tuple[PurePosixPath, zipfile.ZipInfo, str]] = []
+        top_dirs: set[str] = set()
+
+        for info in zf.infolist():
+            path = PurePosixPath(info.filename)
+            if info.is_dir() or len(path.parts) > 1:
+                top_dirs.add(path.parts[0])
+            if info.is_dir() or not detector.should_process(path):
+                continue
+            kept.append((path, info, detector.detect(path)))
+
+        root = PurePosixPath(top_dirs.pop()) if len(top_dirs) == 1 else None
+
+        members: dict[str, tuple[zipfile.ZipInfo, str]] = {}
+        for path, info, lang in kept:
+            if root is not None:
+                if path.parts[0] != root.name or len(path.parts) == 1:
+                    continue
+                path = path.relative_to(root)
+            members[f"{project_id}/{path}"] = (info, lang)
+
+        return members
+
+    def _sync_from_zipfile(self, zip_path: Path, project_id: str) -> SyncResult:
+        """Sync a ZIP archive reading members in memory.
+
+        Members larger than MAX_IN_MEMORY_MEMBER_SIZE are extracted to a
+        temporary directory instead, to keep memory bounded.
+        """
+        from easysql.code_context.utils.file_utils import compute_bytes_hash, compute_file_hash
+
+        with zipfile.ZipFile(zip_path) as zf, ExitStack() as stack:
+            members = self._select_zip_members(zf, project_id)
+
+            spill_dir: Path | None = None
+            spilled: dict[str, Path] = {}
+            hashes: dict[str, str] = {}
+
+            for rel_path, (info, _) in members.items():
+                if info.file_size > MAX_IN_MEMORY_MEMBER_SIZE:
+                    if spill_dir is None:
+                        spill_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+                    disk_path = Path(zf.extract(info, spill_dir))
+                    spilled[rel_path] = disk_path
+                    hashes[rel_path] = compute_file_hash(disk_path)
+                else:
+                    hashes[rel_path] = compute_bytes_hash(zf.read(info))
+
+            changes = self._tracker.detect_changes_from_hashes(hashes)
+
+            def chunk_changed(rel_paths: set[str]) -> ChunkResult:
+                in_memory = (
+                    (
+                        rel_path,
+                        members[rel_path][1],
+                        changes.hashes[rel_path],
+                        zf.read(members[rel_path][0]),
+                    )
+                    for rel_path in sorted(rel_paths)
+                    if rel_path not in spilled
+                )
+                result = self._chunker.chunk_files_from_bytes(in_memory)
+
+                on_disk = [
+                    (rel_path, spilled[rel_path], members[rel_path][1])
+                    for rel_path in sorted(rel_paths)
+                    if rel_path in spilled
+                ]
+                if on_disk:
+                    disk_result = self._chunk_disk_files(on_disk, changes)
+                    result.chunks.extend(disk_result.chunks)
+                    result.errors.extend(disk_result.errors)
+
+                return result
+
+            return self._apply_changes(project_id, changes, chunk_changed)
+
     def sync_from_directory(
         self,
         root_path: Path | str,
@@ -132,6 +232,39 @@ class CodeSyncPipeline:
         path_to_abs = {k: v[0] for k, v in current_files.items()}
         changes = self._tracker.detect_changes(path_to_abs)
 
+        def chunk_changed(rel_paths: set[str]) -> ChunkResult:
+            return self._chunk_disk_files(
+                [(rel_path, *current_files[rel_path]) for rel_path in rel_paths],
+                changes,
+            )
+
+        return self._apply_changes(project_id, changes, chunk_changed)
+
+    def _chunk_disk_files(
+        self,
+        files: list[tuple[str, Path, str]],
+        changes: FileChange,
+    ) -> ChunkResult:
+        """Chunk (rel_path, abs_path, language) files and relabel chunks with rel_path."""
+        abs_to_rel = {str(abs_path): rel_path for rel_path, abs_path, _ in files}
+        chunk_result = self._chunker.chunk_files(
+            [(abs_path, lang, changes.hashes[rel_path]) for rel_path, abs_path, lang in files]
+        )
+
+        for chunk in chunk_result.chunks:
+            rel_path = abs_to_rel.get(chunk.file_path)
+            if rel_path is not None:
+                chunk.relocate(rel_path)
+
+        return chunk_result
+
+    def _apply_changes(
+        self,
+        project_id: str,
+        changes: FileChange,
+        chunk_changed: Callable[[set[str]], ChunkResult],
+    ) -> SyncResult:
+        """Delete removed files, chunk and store changed ones, then update the cache."""
         logger.info(
             f"Project {project_id}: "
             f"added={len(changes.added)}, "
@@ -156,39 +289,32 @@ class CodeSyncPipeline:
         files_to_process = changes.added | changes.modified
 
         if not files_to_process:
+            self._tracker.flush()
             logger.info(f"No files to process for project {project_id}")
             return result
 
-        files_for_chunking: list[tuple[Path, str, str]] = []
-        new_hashes: dict[str, str] = {}
+        # Reuse the hashes change detection already computed
+        new_hashes = {rel_path: changes.hashes[rel_path] for rel_path in files_to_process}
 
-        for rel_path in files_to_process:
-            abs_path, lang = current_files[rel_path]
-            file_hash = self._compute_hash(abs_path)
-            new_hashes[rel_path] = file_hash
-            files_for_chunking.append((abs_path, lang, file_hash))
-
-        chunk_result = self._chunker.chunk_files(files_for_chunking)
-
-        for chunk in chunk_result.chunks:
-            original_path = chunk.file_path
-            for rel_path, (abs_path, _) in current_files.items():
-                if str(abs_path) == original_path:
-                    chunk.file_path = rel_path
-                    break
+        chunk_result = chunk_changed(files_to_process)
 
         if chunk_result.errors:
             result.errors.extend(chunk_result.errors)
 
         if chunk_result.chunks:
             try:
-                self._milvus.upsert_chunks(chunk_result.chunks)
+                # Plain insert is only safe when no chunk of this project is stored yet
+                mode: WriteMode = (
+                    "insert" if not changes.modified and self._milvus.is_empty() else "upsert"
+                )
+                self._milvus.upsert_chunks(chunk_result.chunks, mode=mode)
                 result.chunks_processed = len(chunk_result.chunks)
             except Exception as e:
                 result.errors.append(f"Failed to store chunks: {e}")
 
         if new_hashes:
             self._tracker.update_cache(new_hashes)
+        self._tracker.flush()
 
         logger.info(f"Sync complete for {project_id}: chunks={result.chunks_processed}")
 
@@ -197,6 +323,7 @@ class CodeSyncPipeline:
     def delete_project(self, project_id: str) -> int:
         deleted = self._milvus.delete_by_file_prefix(f"{project_id}/")
         self._tracker.clear_cache()
+        self._tracker.flush()
 
         logger.info(f"Deleted project {project_id}: chunks={deleted}")
         return deleted
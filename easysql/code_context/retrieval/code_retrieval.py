@@ -67,6 +67,7 @@ class CodeRetrievalService:
             table_names=relevant_tables,
             top_k=self._config.top_k,
             score_threshold=self._config.score_threshold,
+            content_limit=self._config.max_snippets,
         )
 
         snippets = results[: self._config.max_snippets]
@@ -81,6 +82,37 @@ class CodeRetrievalService:
             },
         )
 
+    def retrieve_many(
+        self,
+        questions: list[str],
+        relevant_tables: list[str] | None = None,
+    ) -> list[CodeRetrievalResult]:
+        """Retrieve snippets for several questions with a single batched search."""
+        all_results = self._reader.search_many_with_tables(
+            queries=questions,
+            table_names=relevant_tables,
+            top_k=self._config.top_k,
+            score_threshold=self._config.score_threshold,
+            content_limit=self._config.max_snippets,
+        )
+
+        retrieved = []
+        for question, results in zip(questions, all_results, strict=True):
+            snippets = results[: self._config.max_snippets]
+            retrieved.append(
+                CodeRetrievalResult(
+                    snippets=snippets,
+                    stats={
+                        "question": question[:100],
+                        "table_filter": relevant_tables,
+                        "total_found": len(results),
+                        "returned": len(snippets),
+                    },
+                )
+            )
+
+        return retrieved
+
     def retrieve_formatted(
         self,
         question: str,
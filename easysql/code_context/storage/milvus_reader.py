@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from easysql.utils.logger import get_logger
@@ -26,52 +27,138 @@ class CodeMilvusReader:
         self._client = client
         self._embedding = embedding_service
         self._config = config or CodeMilvusConfig()
+        self._collection_exists = False
+        # Per-instance cache of query embeddings, keyed by the exact query text
+        self._encode_cached = lru_cache(maxsize=1024)(self._encode_query)
 
     @property
     def collection_name(self) -> str:
         return self._config.get_collection_name()
 
+    def _has_collection(self) -> bool:
+        """Check collection existence, remembering a positive answer."""
+        if not self._collection_exists:
+            self._collection_exists = self._client.has_collection(self.collection_name)
+        return self._collection_exists
+
+    def _encode_query(self, query: str) -> tuple[float, ...]:
+        return tuple(self._embedding.encode(query))
+
     def search(
         self,
         query: str,
         top_k: int = 5,
         score_threshold: float = 0.0,
         filter_expr: str | None = None,
+        content_limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        if not self._client.has_collection(self.collection_name):
+        if not self._has_collection():
             logger.warning(f"Collection not found: {self.collection_name}")
             return []
 
-        query_embedding = self._embedding.encode(query)
+        query_embedding = list(self._encode_cached(query))
+
+        return self._search_vectors(
+            [query_embedding], top_k, score_threshold, filter_expr, content_limit
+        )[0]
+
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        filter_expr: str | None = None,
+        content_limit: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search several queries with one embedding batch and one Milvus search RPC.
+
+        Returns one hit list per query, in input order.
+        """
+        if not queries:
+            return []
+
+        if not self._has_collection():
+            logger.warning(f"Collection not found: {self.collection_name}")
+            return [[] for _ in queries]
+
+        embeddings = self._embedding.encode_batch(queries)
 
-        search_params = {"metric_type": "COSINE", "params": {"ef": 64}}
+        return self._search_vectors(embeddings, top_k, score_threshold, filter_expr, content_limit)
+
+    def _search_vectors(
+        self,
+        vectors: list[list[float]],
+        top_k: int,
+        score_threshold: float,
+        filter_expr: str | None,
+        content_limit: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Run one search RPC for all vectors.
+
+        With content_limit set, the search returns metadata only and content is
+        fetched afterwards for the best content_limit hits of each query; the
+        remaining hits carry an empty content.
+        """
+        # Range search: Milvus drops hits at or below the threshold server-side.
+        # HNSW needs ef >= limit, so one ef covers the whole query batch.
+        search_params = {
+            "metric_type": "COSINE",
+            "params": {"ef": max(64, top_k), "radius": score_threshold, "range_filter": 1.0},
+        }
+        output_fields = ["file_path", "language"]
+        if content_limit is None:
+            output_fields.append("content")
 
         results = self._client.search(
             collection_name=self.collection_name,
-            data=[query_embedding],
+            data=vectors,
             limit=top_k,
             search_params=search_params,
             filter=filter_expr,
-            output_fields=["file_path", "language", "content"],
+            output_fields=output_fields,
         )
 
-        chunks = []
-        for hit in results[0]:
-            score = hit["distance"]
-            if score < score_threshold:
-                continue
+        if content_limit is None:
+            return [self._hits_to_chunks(hits) for hits in results]
 
-            entity = hit["entity"]
-            chunks.append(
-                {
-                    "file_path": entity.get("file_path", ""),
-                    "language": entity.get("language", ""),
-                    "content": entity.get("content", ""),
-                    "score": score,
-                }
-            )
+        contents = self._fetch_contents(
+            [hit["id"] for hits in results for hit in list(hits)[:content_limit]]
+        )
+        return [self._hits_to_chunks(hits, contents) for hits in results]
 
-        return chunks
+    def _fetch_contents(self, ids: list[str]) -> dict[str, str]:
+        """Fetch content for the given chunk ids in one query."""
+        if not ids:
+            return {}
+        rows = self._client.get(
+            collection_name=self.collection_name,
+            ids=list(dict.fromkeys(ids)),
+            output_fields=["content"],
+        )
+        return {row["id"]: row.get("content", "") for row in rows}
+
+    @staticmethod
+    def _hits_to_chunks(hits: Any, contents: dict[str, str] | None = None) -> list[dict[str, Any]]:
+        return [
+            {
+                "file_path": hit["entity"].get("file_path", ""),
+                "language": hit["entity"].get("language", ""),
+                "content": (
+                    hit["entity"].get("content", "")
+                    if contents is None
+                    else contents.get(hit["id"], "")
+                ),
+                "score": hit["distance"],
+            }
+            for hit in hits
+        ]
+
+    @staticmethod
+    def _with_tables(query: str, table_names: list[str] | None) -> str:
+        if not table_names:
+            return query
+        # Sorted so the same table set always yields the same (cached) query
+        return f"{query} {' '.join(sorted(table_names))}"
 
     def search_with_tables(
         self,
@@ -79,13 +166,26 @@ class CodeMilvusReader:
         table_names: list[str] | None = None,
         top_k: int = 5,
         score_threshold: float = 0.3,
+        content_limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        enhanced_query = query
-        if table_names:
-            enhanced_query = f"{query} {' '.join(table_names)}"
-
         return self.search(
-            query=enhanced_query,
+            query=self._with_tables(query, table_names),
+            top_k=top_k,
+            score_threshold=score_threshold,
+            content_limit=content_limit,
+        )
+
+    def search_many_with_tables(
+        self,
+        queries: list[str],
+        table_names: list[str] | None = None,
+        top_k: int = 5,
+        score_threshold: float = 0.3,
+        content_limit: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        return self.search_many(
+            queries=[self._with_tables(q, table_names) for q in queries],
             top_k=top_k,
             score_threshold=score_threshold,
+            content_limit=content_limit,
         )
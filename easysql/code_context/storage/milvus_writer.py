@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Literal
 
 from pymilvus import DataType
 
@@ -12,16 +16,29 @@ from easysql.utils.logger import get_logger
 if TYPE_CHECKING:
     from pymilvus import MilvusClient
 
-    from easysql.code_context.chunker import CodeChunk
+    from easysql.code_context.chunker import ChunkTable, CodeChunk
     from easysql.embeddings.embedding_service import EmbeddingService
 
 logger = get_logger(__name__)
 
+WriteMode = Literal["insert", "upsert"]
+
+# Rows per Milvus write request, capped by an approximate payload size
+DEFAULT_WRITE_BATCH_SIZE = 1000
+MAX_WRITE_BATCH_BYTES = 30 * 1024 * 1024
+
+# File paths per `file_path in [...]` delete expression
+DELETE_BATCH_SIZE = 512
+
+# VARCHAR limit of the content field
+MAX_CONTENT_LENGTH = 16000
+
 
 @dataclass
 class CodeMilvusConfig:
     collection_name: str = "code_chunks"
     database_prefix: str = ""
+    upload_concurrency: int = 4
 
     def get_collection_name(self) -> str:
         if self.database_prefix:
@@ -32,18 +49,25 @@ class CodeMilvusConfig:
 class CodeMilvusWriter:
     def __init__(
         self,
-        client: "MilvusClient",
-        embedding_service: "EmbeddingService",
+        client: MilvusClient,
+        embedding_service: EmbeddingService,
         config: CodeMilvusConfig | None = None,
     ):
         self._client = client
         self._embedding = embedding_service
         self._config = config or CodeMilvusConfig()
+        self._collection_exists = False
 
     @property
     def collection_name(self) -> str:
         return self._config.get_collection_name()
 
+    def _has_collection(self) -> bool:
+        """Check collection existence, remembering a positive answer."""
+        if not self._collection_exists:
+            self._collection_exists = self._client.has_collection(self.collection_name)
+        return self._collection_exists
+
     def create_collection(self, drop_existing: bool = False) -> None:
         collection_name = self.collection_name
         dim = self._embedding.dimension
@@ -52,7 +76,9 @@ class CodeMilvusWriter:
             if drop_existing:
                 logger.warning(f"Dropping existing collection: {collection_name}")
                 self._client.drop_collection(collection_name)
+                self._collection_exists = False
             else:
+                self._collection_exists = True
                 logger.info(f"Collection already exists: {collection_name}")
                 return
 
@@ -64,7 +90,7 @@ class CodeMilvusWriter:
         schema.add_field("file_path", DataType.VARCHAR, max_length=512)
         schema.add_field("file_hash", DataType.VARCHAR, max_length=64)
         schema.add_field("language", DataType.VARCHAR, max_length=32)
-        schema.add_field("content", DataType.VARCHAR, max_length=16000)
+        schema.add_field("content", DataType.VARCHAR, max_length=MAX_CONTENT_LENGTH)
         schema.add_field("embedding", DataType.FLOAT_VECTOR, dim=dim)
 
         index_params = self._client.prepare_index_params()
@@ -80,65 +106,176 @@ class CodeMilvusWriter:
             schema=schema,
             index_params=index_params,
         )
+        self._collection_exists = True
         logger.info(f"Collection created: {collection_name}")
 
     def upsert_chunks(
         self,
-        chunks: list["CodeChunk"],
+        chunks: list[CodeChunk],
         batch_size: int = 100,
+        mode: WriteMode = "upsert",
     ) -> int:
         if not chunks:
             return 0
 
-        texts = [chunk.to_embedding_text() for chunk in chunks]
-        embeddings = self._embedding.encode_batch(texts, batch_size=batch_size)
-
-        data = []
-        for chunk, embedding in zip(chunks, embeddings):
-            data.append(
-                {
-                    "id": chunk.chunk_id,
-                    "file_path": chunk.file_path,
-                    "file_hash": chunk.file_hash,
-                    "language": chunk.language,
-                    "content": chunk.content[:16000],
-                    "embedding": embedding,
-                }
-            )
+        from easysql.code_context.chunker import ChunkTable
+
+        return self.upsert_table(ChunkTable.from_chunks(chunks), batch_size=batch_size, mode=mode)
+
+    def upsert_chunk_stream(
+        self,
+        chunks: Iterable[CodeChunk],
+        batch_size: int = 100,
+        stream_batch_size: int = 2000,
+        mode: WriteMode = "upsert",
+    ) -> int:
+        """Embed and upsert chunks from an iterator in fixed-size slices.
+
+        Only stream_batch_size chunks are held in memory at a time, which pairs
+        with CodeChunker.iter_chunk_files for large repositories.
+        """
+        iterator = iter(chunks)
+        total = 0
+        while batch := list(islice(iterator, stream_batch_size)):
+            total += self.upsert_chunks(batch, batch_size=batch_size, mode=mode)
+        return total
+
+    def upsert_table(
+        self,
+        table: ChunkTable,
+        batch_size: int = 100,
+        mode: WriteMode = "upsert",
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> int:
+        """Embed and write a ChunkTable.
+
+        Embedding and writing overlap: each write batch is handed to the upload
+        pool as soon as its embeddings are ready, while the next batch is
+        being embedded.
+
+        Args:
+            table: Chunks to write.
+            batch_size: Embedding batch size.
+            mode: "insert" skips Milvus' primary-key existence check and is only
+                safe when none of the chunk IDs are stored yet; "upsert" otherwise.
+            write_batch_size: Maximum rows per Milvus request. Requests are also
+                flushed once their approximate payload reaches MAX_WRITE_BATCH_BYTES.
+        """
+        if not len(table):
+            return 0
+
+        batches = self._iter_write_batches(table, batch_size, write_batch_size)
+        total = self._write_batches(batches, mode)
+
+        logger.info(f"Wrote {total} chunks to {self.collection_name} ({mode})")
+        return total
 
+    def _iter_write_batches(
+        self,
+        table: ChunkTable,
+        batch_size: int,
+        write_batch_size: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Embed the table lazily and group rows into size-capped write batches."""
+        texts = table.embedding_texts()
+        vector_bytes = self._embedding.dimension * 4
+
+        batch: list[dict[str, Any]] = []
+        batch_bytes = 0
+        for start, embeddings in self._embedding.iter_encode_batches(texts, batch_size):
+            end = start + len(embeddings)
+            # MilvusClient only takes row dicts; build them from column slices in one pass
+            for chunk_id, file_path, file_hash, language, content, embedding in zip(
+                table.chunk_ids[start:end],
+                table.file_paths[start:end],
+                table.file_hashes[start:end],
+                table.languages[start:end],
+                table.contents[start:end],
+                embeddings,
+                strict=True,
+            ):
+                content = content[:MAX_CONTENT_LENGTH]
+                batch.append(
+                    {
+                        "id": chunk_id,
+                        "file_path": file_path,
+                        "file_hash": file_hash,
+                        "language": language,
+                        "content": content,
+                        "embedding": embedding,
+                    }
+                )
+                batch_bytes += len(content) + len(chunk_id) + vector_bytes
+                if len(batch) >= write_batch_size or batch_bytes >= MAX_WRITE_BATCH_BYTES:
+                    yield batch
+                    batch = []
+                    batch_bytes = 0
+        if batch:
+            yield batch
+
+    def _write_batches(self, batches: Iterable[list[dict[str, Any]]], mode: WriteMode) -> int:
+        """Send write batches with up to upload_concurrency requests in flight.
+
+        batches is consumed lazily on the calling thread, so producing the next
+        batch overlaps with the uploads already running.
+        """
+        write = self._client.insert if mode == "insert" else self._client.upsert
+        workers = max(1, self._config.upload_concurrency)
+        in_flight: deque[Any] = deque()
         total = 0
-        for i in range(0, len(data), batch_size):
-            batch = data[i : i + batch_size]
-            self._client.upsert(collection_name=self.collection_name, data=batch)
-            total += len(batch)
 
-        logger.info(f"Upserted {total} chunks to {self.collection_name}")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                for batch in batches:
+                    if len(in_flight) >= workers * 2:
+                        total += in_flight.popleft().result()
+                    in_flight.append(executor.submit(self._write_batch, write, batch))
+                while in_flight:
+                    total += in_flight.popleft().result()
+            except Exception:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
         return total
 
+    def _write_batch(self, write: Any, batch: list[dict[str, Any]]) -> int:
+        write(collection_name=self.collection_name, data=batch)
+        return len(batch)
+
+    def is_empty(self) -> bool:
+        """Whether the collection is missing or holds no rows."""
+        if not self._has_collection():
+            return True
+        info = self._client.get_collection_stats(self.collection_name)
+        return int(info.get("row_count", 0)) == 0
+
     def delete_by_file_paths(self, file_paths: set[str]) -> int:
         if not file_paths:
             return 0
 
-        if not self._client.has_collection(self.collection_name):
+        if not self._has_collection():
             return 0
 
-        paths_str = ", ".join(f'"{p}"' for p in file_paths)
-        filter_expr = f"file_path in [{paths_str}]"
+        paths = sorted(file_paths)
+        deleted = 0
 
         try:
-            result = self._client.delete(
-                collection_name=self.collection_name,
-                filter=filter_expr,
-            )
-            deleted = result.get("delete_count", 0) if isinstance(result, dict) else 0
+            for i in range(0, len(paths), DELETE_BATCH_SIZE):
+                paths_str = ", ".join(f'"{p}"' for p in paths[i : i + DELETE_BATCH_SIZE])
+                result = self._client.delete(
+                    collection_name=self.collection_name,
+                    filter=f"file_path in [{paths_str}]",
+                )
+                deleted += result.get("delete_count", 0) if isinstance(result, dict) else 0
             logger.info(f"Deleted {deleted} chunks for {len(file_paths)} files")
             return deleted
         except Exception as e:
             logger.warning(f"Failed to delete chunks: {e}")
-            return 0
+            return deleted
 
     def delete_by_file_prefix(self, prefix: str) -> int:
-        if not self._client.has_collection(self.collection_name):
+        if not self._has_collection():
             return 0
 
         filter_expr = f'file_path like "{prefix}%"'
@@ -156,7 +293,7 @@ class CodeMilvusWriter:
             return 0
 
     def get_stats(self) -> dict[str, Any]:
-        if not self._client.has_collection(self.collection_name):
+        if not self._has_collection():
             return {"collection": self.collection_name, "exists": False}
 
         info = self._client.get_collection_stats(self.collection_name)
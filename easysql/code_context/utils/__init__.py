@@ -1,7 +1,15 @@
-from .file_utils import FileChange, FileTracker, LanguageDetector
+from .file_utils import (
+    FileChange,
+    FileTracker,
+    LanguageDetector,
+    compute_bytes_hash,
+    compute_file_hash,
+)
 
 __all__ = [
     "FileChange",
     "FileTracker",
     "LanguageDetector",
+    "compute_bytes_hash",
+    "compute_file_hash",
 ]
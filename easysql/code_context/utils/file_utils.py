@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-import hashlib
-import json
-from dataclasses import dataclass
-from pathlib import Path
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import translate
+from pathlib import Path, PurePath
+from typing import Any
+
+import orjson
+from blake3 import blake3
 
 EXTENSION_MAP: dict[str, str] = {
     ".cs": "csharp",
@@ -46,6 +53,41 @@ EXCLUDE_PATTERNS = {
 }
 
 
+# Bump whenever compute_file_hash changes so stale caches are discarded
+CACHE_FORMAT_VERSION = 3
+
+
+_HASH_BUFFER_SIZE = 1 << 20
+_hash_buffers = threading.local()
+
+
+def _get_hash_buffer() -> memoryview:
+    """Per-thread read buffer reused across compute_file_hash calls."""
+    buffer = getattr(_hash_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _hash_buffers.buffer = memoryview(bytearray(_HASH_BUFFER_SIZE))
+    return buffer
+
+
+def compute_bytes_hash(data: bytes) -> str:
+    """Same digest as compute_file_hash, for content already in memory."""
+    return blake3(data).hexdigest(length=16)
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """Content hash used for change detection (BLAKE3, 128-bit hex digest).
+
+    The file is streamed through a fixed per-thread buffer, so memory use does
+    not grow with file size.
+    """
+    hasher = blake3()
+    buffer = _get_hash_buffer()
+    with open(file_path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            hasher.update(buffer[:n])
+    return hasher.hexdigest(length=16)
+
+
 class LanguageDetector:
     def __init__(
         self,
@@ -56,40 +98,45 @@ class LanguageDetector:
         self._supported = (
             set(supported_languages) if supported_languages else set(EXTENSION_MAP.values())
         )
-        self._exclude_dirs = exclude_dirs or EXCLUDE_DIRS
+        self._exclude_dirs = frozenset(exclude_dirs or EXCLUDE_DIRS)
         self._exclude_patterns = exclude_patterns or EXCLUDE_PATTERNS
+        # One alternation of all exclude globs, matched against the file name
+        self._exclude_re = re.compile(
+            "|".join(f"(?:{translate(p)})" for p in sorted(self._exclude_patterns)) or "(?!)"
+        )
 
-    def detect(self, file_path: Path) -> str:
+    def detect(self, file_path: PurePath) -> str:
         suffix = file_path.suffix.lower()
         lang = EXTENSION_MAP.get(suffix, "unknown")
         if lang not in self._supported:
             return "unknown"
         return lang
 
-    def should_process(self, file_path: Path) -> bool:
+    def should_process(self, file_path: PurePath) -> bool:
         for parent in file_path.parents:
             if parent.name in self._exclude_dirs:
                 return False
 
-        for pattern in self._exclude_patterns:
-            if file_path.match(pattern):
-                return False
+        if self._exclude_re.match(file_path.name):
+            return False
 
         return self.detect(file_path) != "unknown"
 
     def scan_directory(self, root: Path) -> dict[str, list[Path]]:
         result: dict[str, list[Path]] = {}
 
-        for file_path in root.rglob("*"):
-            if not file_path.is_file():
-                continue
-            if not self.should_process(file_path):
-                continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            # Prune excluded directories so os.walk never descends into them
+            dirnames[:] = [d for d in dirnames if d not in self._exclude_dirs]
 
-            lang = self.detect(file_path)
-            if lang not in result:
-                result[lang] = []
-            result[lang].append(file_path)
+            for name in filenames:
+                lang = EXTENSION_MAP.get(os.path.splitext(name)[1].lower())
+                if lang is None or lang not in self._supported:
+                    continue
+                if self._exclude_re.match(name):
+                    continue
+
+                result.setdefault(lang, []).append(Path(dirpath, name))
 
         return result
 
@@ -99,6 +146,7 @@ class FileChange:
     added: set[str]
     modified: set[str]
     deleted: set[str]
+    hashes: dict[str, str] = field(default_factory=dict)
 
     @property
     def has_changes(self) -> bool:
@@ -110,66 +158,167 @@ class FileChange:
 
 
 class FileTracker:
-    def __init__(self, cache_path: Path):
+    """Tracks file content hashes between syncs.
+
+    Each cache entry stores the content hash plus the file size and mtime seen
+    when it was hashed. detect_changes only re-reads a file when its size or
+    mtime differs from the cached values.
+
+    Mutations only mark the cache dirty; call flush() to persist them.
+    """
+
+    def __init__(self, cache_path: Path, max_workers: int | None = None):
         self._cache_path = cache_path
-        self._hash_cache: dict[str, str] = self._load_cache()
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) * 2)
+        self._entries: dict[str, dict[str, Any]] = self._load_cache()
+        self._dirty = False
+        # (size, mtime_ns, hash) observed by the latest detect_changes call
+        self._observed: dict[str, tuple[int, int, str]] = {}
 
     def _compute_hash(self, file_path: Path) -> str:
-        content = file_path.read_bytes()
-        return hashlib.md5(content).hexdigest()
+        return compute_file_hash(file_path)
 
     def detect_changes(self, current_files: dict[str, Path]) -> FileChange:
         added: set[str] = set()
         modified: set[str] = set()
         current_hashes: dict[str, str] = {}
+        refreshed = False
+        self._observed = {}
+
+        stats = {rel_path: abs_path.stat() for rel_path, abs_path in current_files.items()}
+        to_hash = [
+            rel_path
+            for rel_path, st in stats.items()
+            if not self._stat_matches(self._entries.get(rel_path), st)
+        ]
+        fresh_hashes = self._hash_files([current_files[p] for p in to_hash])
+        computed = dict(zip(to_hash, fresh_hashes, strict=True))
+
+        for rel_path in current_files:
+            st = stats[rel_path]
+            entry = self._entries.get(rel_path)
+
+            if rel_path in computed:
+                file_hash = computed[rel_path]
+                if entry is not None and entry["hash"] == file_hash:
+                    # Touched but unchanged: remember the new stat to skip it next time
+                    entry["size"] = st.st_size
+                    entry["mtime_ns"] = st.st_mtime_ns
+                    refreshed = True
+            else:
+                assert entry is not None
+                file_hash = entry["hash"]
 
-        for rel_path, abs_path in current_files.items():
-            file_hash = self._compute_hash(abs_path)
             current_hashes[rel_path] = file_hash
+            self._observed[rel_path] = (st.st_size, st.st_mtime_ns, file_hash)
 
-            if rel_path not in self._hash_cache:
+            if entry is None:
                 added.add(rel_path)
-            elif self._hash_cache[rel_path] != file_hash:
+            elif entry["hash"] != file_hash:
                 modified.add(rel_path)
 
-        deleted = set(self._hash_cache.keys()) - set(current_files.keys())
+        deleted = set(self._entries.keys()) - set(current_files.keys())
 
-        return FileChange(added=added, modified=modified, deleted=deleted)
+        if refreshed:
+            self._dirty = True
+
+        return FileChange(
+            added=added,
+            modified=modified,
+            deleted=deleted,
+            hashes=current_hashes,
+        )
+
+    def detect_changes_from_hashes(self, current_hashes: dict[str, str]) -> FileChange:
+        """Classify changes for content hashed by the caller (e.g. archive members)."""
+        self._observed = {}
+        added = {p for p in current_hashes if p not in self._entries}
+        modified = {
+            p
+            for p, file_hash in current_hashes.items()
+            if p in self._entries and self._entries[p]["hash"] != file_hash
+        }
+        deleted = set(self._entries.keys()) - set(current_hashes.keys())
+
+        return FileChange(
+            added=added,
+            modified=modified,
+            deleted=deleted,
+            hashes=dict(current_hashes),
+        )
+
+    @staticmethod
+    def _stat_matches(entry: dict[str, Any] | None, st: os.stat_result) -> bool:
+        return (
+            entry is not None
+            and entry.get("size") == st.st_size
+            and entry.get("mtime_ns") == st.st_mtime_ns
+        )
+
+    def _hash_files(self, paths: list[Path]) -> list[str]:
+        """Hash files on a thread pool; the hasher releases the GIL while reading."""
+        if self._max_workers == 1 or len(paths) <= 1:
+            return [self._compute_hash(p) for p in paths]
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(paths))) as executor:
+            return list(executor.map(self._compute_hash, paths))
 
     def update_cache(self, file_hashes: dict[str, str]) -> None:
-        self._hash_cache.update(file_hashes)
-        self._save_cache()
+        for rel_path, file_hash in file_hashes.items():
+            entry: dict[str, Any] = {"hash": file_hash}
+            observed = self._observed.get(rel_path)
+            if observed is not None and observed[2] == file_hash:
+                entry["size"], entry["mtime_ns"] = observed[0], observed[1]
+            self._entries[rel_path] = entry
+        self._dirty = True
 
     def remove_from_cache(self, paths: set[str]) -> None:
         for path in paths:
-            self._hash_cache.pop(path, None)
-        self._save_cache()
+            if self._entries.pop(path, None) is not None:
+                self._dirty = True
 
     def clear_cache(self) -> None:
-        self._hash_cache.clear()
-        self._save_cache()
+        if self._entries:
+            self._entries.clear()
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending cache changes to disk."""
+        if self._dirty:
+            self._save_cache()
+            self._dirty = False
 
-    def _load_cache(self) -> dict[str, str]:
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
         if self._cache_path.exists():
             try:
-                data = json.loads(self._cache_path.read_text(encoding="utf-8"))
-                if isinstance(data, dict):
-                    return {str(k): str(v) for k, v in data.items()}
+                data = orjson.loads(self._cache_path.read_bytes())
+                if isinstance(data, dict) and data.get("version") == CACHE_FORMAT_VERSION:
+                    files = data.get("files")
+                    if isinstance(files, dict):
+                        return {
+                            str(k): v
+                            for k, v in files.items()
+                            if isinstance(v, dict) and isinstance(v.get("hash"), str)
+                        }
                 return {}
-            except (json.JSONDecodeError, OSError):
+            except (orjson.JSONDecodeError, OSError):
                 return {}
         return {}
 
     def _save_cache(self) -> None:
+        # Write to a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated cache behind
         self._cache_path.parent.mkdir(parents=True, exist_ok=True)
-        self._cache_path.write_text(
-            json.dumps(self._hash_cache, indent=2, ensure_ascii=False),
-            encoding="utf-8",
+        tmp_path = self._cache_path.with_suffix(self._cache_path.suffix + ".tmp")
+        tmp_path.write_bytes(
+            orjson.dumps({"version": CACHE_FORMAT_VERSION, "files": self._entries})
         )
+        os.replace(tmp_path, self._cache_path)
 
     def get_file_hash(self, rel_path: str) -> str | None:
-        return self._hash_cache.get(rel_path)
+        entry = self._entries.get(rel_path)
+        return entry["hash"] if entry is not None else None
 
     @property
     def cached_file_count(self) -> int:
-        return len(self._hash_cache)
+        return len(self._entries)
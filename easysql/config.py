@@ -6,23 +6,62 @@ Uses Pydantic Settings for validation and type coercion.
 """
 
 import os
-import re
+import string
+import sys
+from collections import defaultdict
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
 from copy import deepcopy
-from functools import lru_cache
+from dataclasses import dataclass, field
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 from threading import RLock
 from typing import Any
 
-from pydantic import AliasChoices, Field, field_validator, model_validator
+from pydantic import AliasChoices, Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from easysql.utils.logger import get_logger
 
-logger = get_logger(__name__)
+@cache
+def _log() -> Any:
+    """Module logger, created on first use so importing config does not load loguru."""
+    from easysql.utils.logger import get_logger
+
+    return get_logger(__name__)
+
 
 _RUNTIME_OVERRIDES: dict[str, Any] = {}
 _RUNTIME_OVERRIDES_LOCK = RLock()
 
+# Accepted values for the enum-like string settings
+_VALID_CHECKPOINTER_BACKENDS = frozenset({"memory", "postgres"})
+_VALID_SESSION_BACKENDS = frozenset({"postgres"})
+_VALID_QUERY_MODES = frozenset({"plan", "fast"})
+_VALID_EMBEDDING_PROVIDERS = frozenset({"local", "openai_api", "tei"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# Characters allowed in <NAME> of a DB_<NAME>_TYPE key (checked after lowercasing)
+_DB_NAME_CHARS = string.ascii_lowercase + string.digits + "_"
+
+# Pre-filtered DB_* environment handed to parse_database_configs instead of os.environ
+_DB_ENV_SNAPSHOT: ContextVar[Mapping[str, str] | None] = ContextVar(
+    "_DB_ENV_SNAPSHOT", default=None
+)
+
+# DB_<NAME>_<suffix> -> (DatabaseConfig argument, default)
+_DB_FIELDS: tuple[tuple[str, str, Any], ...] = (
+    ("type", "db_type", ""),
+    ("host", "host", "localhost"),
+    ("port", "port", 3306),
+    ("user", "user", "root"),
+    ("password", "password", ""),
+    ("database", "database", ""),
+    ("schema", "schema", None),
+    ("system_type", "system_type", "UNKNOWN"),
+    ("description", "description", ""),
+)
+_DB_KEY_SUFFIXES = tuple((f"_{suffix}", arg) for suffix, arg, _ in _DB_FIELDS)
+
 
 def replace_runtime_overrides(overrides: dict[str, Any]) -> None:
     """Replace all runtime overrides with the provided mapping."""
@@ -55,74 +94,108 @@ def _apply_override_path(settings: "Settings", path: str, value: Any) -> None:
     target: Any = settings
     for part in parts[:-1]:
         if not hasattr(target, part):
-            logger.warning(f"Skip unknown override path segment: {path}")
+            _log().warning(f"Skip unknown override path segment: {path}")
             return
         target = getattr(target, part)
 
     leaf = parts[-1]
     if not hasattr(target, leaf):
-        logger.warning(f"Skip unknown override path leaf: {path}")
+        _log().warning(f"Skip unknown override path leaf: {path}")
         return
 
     setattr(target, leaf, value)
 
 
+# SQLAlchemy URL template per database type
+_CONNECTION_TEMPLATES: dict[str, str] = {
+    "mysql": "mysql+pymysql://{user}:{password}@{host}:{port}/{database}",
+    "postgresql": "postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}",
+    # Oracle using oracledb driver (thin mode by default)
+    "oracle": "oracle+oracledb://{user}:{password}@{host}:{port}/?service_name={database}",
+    # SQL Server using pyodbc driver
+    "sqlserver": (
+        "mssql+pyodbc://{user}:{password}@{host}:{port}/{database}"
+        "?driver=ODBC+Driver+17+for+SQL+Server"
+    ),
+}
+
+
+def _public_schema(config: "DatabaseConfig") -> str:
+    return "public"
+
+
+def _database_schema(config: "DatabaseConfig") -> str:
+    return config.database  # MySQL uses database as schema
+
+
+def _user_schema(config: "DatabaseConfig") -> str:
+    return config.user.upper()  # Oracle uses user as schema
+
+
+def _dbo_schema(config: "DatabaseConfig") -> str:
+    return "dbo"
+
+
+# Default schema per database type when none is configured
+_DEFAULT_SCHEMAS: dict[str, Callable[["DatabaseConfig"], str]] = {
+    "mysql": _database_schema,
+    "postgresql": _public_schema,
+    "oracle": _user_schema,
+    "sqlserver": _dbo_schema,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Configuration for a single source database."""
 
-    def __init__(
-        self,
-        name: str,
-        db_type: str,
-        host: str,
-        port: int,
-        user: str,
-        password: str,
-        database: str,
-        schema: str | None = None,
-        system_type: str = "UNKNOWN",
-        description: str = "",
-    ):
-        self.name = name
-        self.db_type = db_type.lower()
-        self.host = host
-        self.port = port
-        self.user = user
-        self.password = password
-        self.database = database
-        self.schema = schema
-        self.system_type = system_type
-        self.description = description
+    name: str
+    db_type: str
+    host: str
+    port: int
+    user: str
+    password: str
+    database: str
+    schema: str | None = None
+    system_type: str = "UNKNOWN"
+    description: str = ""
+    _connection_template: str | None = field(init=False, repr=False, compare=False)
+    _default_schema: Callable[["DatabaseConfig"], str] = field(
+        init=False, repr=False, compare=False
+    )
+    # Resolved on first use; the config is frozen, so they never go stale
+    _cached_schema: str | None = field(default=None, init=False, repr=False, compare=False)
+    _cached_conn: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        db_type = sys.intern(self.db_type.lower())
+        object.__setattr__(self, "db_type", db_type)
+        object.__setattr__(self, "_connection_template", _CONNECTION_TEMPLATES.get(db_type))
+        object.__setattr__(self, "_default_schema", _DEFAULT_SCHEMAS.get(db_type, _public_schema))
 
     def get_default_schema(self) -> str:
         """Get default schema based on database type."""
-        if self.schema:
-            return self.schema
-        if self.db_type == "mysql":
-            return self.database  # MySQL uses database as schema
-        elif self.db_type == "postgresql":
-            return "public"
-        elif self.db_type == "oracle":
-            return self.user.upper()  # Oracle uses user as schema
-        elif self.db_type == "sqlserver":
-            return "dbo"
-        else:
-            return "public"
+        schema = self._cached_schema
+        if schema is None:
+            schema = self.schema or self._default_schema(self)
+            object.__setattr__(self, "_cached_schema", schema)
+        return schema
 
     def get_connection_string(self) -> str:
         """Generate SQLAlchemy connection string based on database type."""
-        if self.db_type == "mysql":
-            return f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
-        elif self.db_type == "postgresql":
-            return f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
-        elif self.db_type == "oracle":
-            # Oracle using oracledb driver (thin mode by default)
-            return f"oracle+oracledb://{self.user}:{self.password}@{self.host}:{self.port}/?service_name={self.database}"
-        elif self.db_type == "sqlserver":
-            # SQL Server using pyodbc driver
-            return f"mssql+pyodbc://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}?driver=ODBC+Driver+17+for+SQL+Server"
-        else:
-            raise ValueError(f"Unsupported database type: {self.db_type}")
+        conn = self._cached_conn
+        if conn is None:
+            if self._connection_template is None:
+                raise ValueError(f"Unsupported database type: {self.db_type}")
+            conn = self._connection_template.format(
+                user=self.user,
+                password=self.password,
+                host=self.host,
+                port=self.port,
+                database=self.database,
+            )
+            object.__setattr__(self, "_cached_conn", conn)
+        return conn
 
     def __repr__(self) -> str:
         return f"DatabaseConfig(name={self.name}, type={self.db_type}, database={self.database}, schema={self.get_default_schema()})"
@@ -136,58 +209,63 @@ class CheckpointerConfig(BaseSettings):
     All settings can be overridden via CHECKPOINTER_* environment variables.
     """
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        env_prefix="checkpointer_",
+        populate_by_name=True,
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
 
     # Storage backend: "memory" or "postgres"
     backend: str = Field(
         default="memory",
-        alias="checkpointer_backend",
         description="Checkpointer backend: memory or postgres",
     )
 
     # PostgreSQL connection settings
-    postgres_host: str = Field(
-        default="localhost", alias="checkpointer_postgres_host", description="PostgreSQL host"
-    )
-    postgres_port: int = Field(
-        default=5432, alias="checkpointer_postgres_port", description="PostgreSQL port"
-    )
-    postgres_user: str = Field(
-        default="postgres", alias="checkpointer_postgres_user", description="PostgreSQL user"
-    )
-    postgres_password: str = Field(
-        default="", alias="checkpointer_postgres_password", description="PostgreSQL password"
-    )
-    postgres_database: str = Field(
-        default="easysql", alias="checkpointer_postgres_database", description="PostgreSQL database"
-    )
+    postgres_host: str = Field(default="localhost", description="PostgreSQL host")
+    postgres_port: int = Field(default=5432, description="PostgreSQL port")
+    postgres_user: str = Field(default="postgres", description="PostgreSQL user")
+    postgres_password: str = Field(default="", description="PostgreSQL password")
+    postgres_database: str = Field(default="easysql", description="PostgreSQL database")
 
     # Connection pool settings
-    pool_min_size: int = Field(
-        default=1, alias="checkpointer_pool_min_size", description="Minimum pool connections"
-    )
-    pool_max_size: int = Field(
-        default=10, alias="checkpointer_pool_max_size", description="Maximum pool connections"
-    )
+    pool_min_size: int = Field(default=1, description="Minimum pool connections")
+    pool_max_size: int = Field(default=10, description="Maximum pool connections")
+
+    _postgres_uri: str | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._postgres_uri = None
 
     @property
     def postgres_uri(self) -> str:
-        """Build PostgreSQL connection URI."""
-        return (
-            f"postgresql://{self.postgres_user}:{self.postgres_password}"
-            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_database}"
-        )
+        """Build PostgreSQL connection URI (cached until a field changes)."""
+        uri = self._postgres_uri
+        if uri is None:
+            uri = self._postgres_uri = (
+                f"postgresql://{self.postgres_user}:{self.postgres_password}"
+                f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_database}"
+            )
+        return uri
 
     def is_postgres(self) -> bool:
         """Check if using PostgreSQL backend."""
-        return self.backend.lower() == "postgres"
+        # backend is lowercased by validate_backend
+        return self.backend == "postgres"
 
     @field_validator("backend")
     @classmethod
     def validate_backend(cls, v: str) -> str:
-        valid_backends = {"memory", "postgres"}
-        if v.lower() not in valid_backends:
-            raise ValueError(f"CHECKPOINTER_BACKEND must be one of {valid_backends}")
+        if v.lower() not in _VALID_CHECKPOINTER_BACKENDS:
+            raise ValueError(
+                f"CHECKPOINTER_BACKEND must be one of {set(_VALID_CHECKPOINTER_BACKENDS)}"
+            )
         return v.lower()
 
 
@@ -199,26 +277,40 @@ class LangfuseConfig(BaseSettings):
     All settings can be overridden via LANGFUSE_* environment variables.
     """
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
-
-    enabled: bool = Field(
-        default=False, alias="langfuse_enabled", description="Enable LangFuse tracing"
-    )
-    public_key: str | None = Field(
-        default=None, alias="langfuse_public_key", description="LangFuse public key"
-    )
-    secret_key: str | None = Field(
-        default=None, alias="langfuse_secret_key", description="LangFuse secret key"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        env_prefix="langfuse_",
+        populate_by_name=True,
+        validate_assignment=False,
+        revalidate_instances="never",
     )
+
+    enabled: bool = Field(default=False, description="Enable LangFuse tracing")
+    public_key: str | None = Field(default=None, description="LangFuse public key")
+    secret_key: str | None = Field(default=None, description="LangFuse secret key")
     host: str = Field(
         default="https://cloud.langfuse.com",
         validation_alias=AliasChoices("langfuse_base_url", "langfuse_host"),
         description="LangFuse base URL (cloud or self-hosted)",
     )
 
+    _configured: bool | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Runtime overrides assign fields after construction
+        if not name.startswith("_"):
+            self._configured = None
+
     def is_configured(self) -> bool:
         """Check if LangFuse is properly configured with required credentials."""
-        return bool(self.enabled and self.public_key and self.secret_key)
+        configured = self._configured
+        if configured is None:
+            configured = bool(self.enabled and self.public_key and self.secret_key)
+            self._configured = configured
+        return configured
 
 
 class LLMConfig(BaseSettings):
@@ -226,7 +318,13 @@ class LLMConfig(BaseSettings):
     Configuration for the LLM layer.
     """
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
 
     # Query Mode: 'plan' (HITL enabled) or 'fast' (direct execution)
     query_mode: str = Field(default="plan", description="Query execution mode")
@@ -278,29 +376,43 @@ class LLMConfig(BaseSettings):
     # Retry Configuration
     max_sql_retries: int = Field(default=3, description="Max SQL generation retries")
 
+    # (model, provider), resolved together on first use
+    _resolved: tuple[str, str] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Runtime overrides assign fields after construction
+        if not name.startswith("_"):
+            self._resolved = None
+
+    def _resolve(self) -> tuple[str, str]:
+        """Resolve model and provider by priority: Google > Anthropic > OpenAI."""
+        resolved = self._resolved
+        if resolved is None:
+            if self.google_llm_model and self.google_api_key:
+                resolved = (self.google_llm_model, "google_genai")
+            elif self.anthropic_llm_model and self.anthropic_api_key:
+                resolved = (self.anthropic_llm_model, "anthropic")
+            else:
+                resolved = (self.openai_llm_model, "openai")
+            self._resolved = resolved
+        return resolved
+
     def get_model(self) -> str:
         """Get the primary model based on priority: Google > Anthropic > OpenAI.
 
         Also auto-selects the provider based on which model is configured.
         """
-        if self.google_llm_model and self.google_api_key:
-            return self.google_llm_model
-        if self.anthropic_llm_model and self.anthropic_api_key:
-            return self.anthropic_llm_model
-        return self.openai_llm_model
+        return self._resolve()[0]
 
     def get_provider(self) -> str:
         """Get the provider based on model priority: Google > Anthropic > OpenAI."""
-        if self.google_llm_model and self.google_api_key:
-            return "google_genai"
-        if self.anthropic_llm_model and self.anthropic_api_key:
-            return "anthropic"
-        return "openai"
+        return self._resolve()[1]
 
     @field_validator("query_mode")
     @classmethod
     def validate_query_mode(cls, v: str) -> str:
-        if v.lower() not in ["plan", "fast"]:
+        if v.lower() not in _VALID_QUERY_MODES:
             raise ValueError("QUERY_MODE must be 'plan' or 'fast'")
         return v.lower()
 
@@ -326,6 +438,9 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="allow",  # Allow extra fields for dynamic DB configs
+        # Configs are static after load: no re-validation on assignment or nesting
+        validate_assignment=False,
+        revalidate_instances="never",
     )
 
     # Neo4j Configuration
@@ -434,7 +549,8 @@ class Settings(BaseSettings):
 
     def is_session_postgres(self) -> bool:
         """Check if session storage uses PostgreSQL backend."""
-        return self.session_backend.lower() == "postgres"
+        # session_backend is lowercased by validate_session_backend
+        return self.session_backend == "postgres"
 
     def get_session_postgres_uri(self) -> str | None:
         """Resolve the PostgreSQL URI for session storage.
@@ -444,7 +560,7 @@ class Settings(BaseSettings):
         if self.session_postgres_uri:
             return self.session_postgres_uri
         if self.checkpointer.is_postgres():
-            logger.warning(
+            _log().warning(
                 "SESSION_POSTGRES_URI not set; falling back to checkpointer Postgres URI"
             )
             return self.checkpointer.postgres_uri
@@ -475,7 +591,7 @@ class Settings(BaseSettings):
         description="Prefix for code context Milvus collection names",
     )
 
-    @property
+    @cached_property
     def code_context_languages_list(self) -> list[str]:
         """Parse supported languages into list."""
         if not self.code_context_supported_languages:
@@ -495,7 +611,7 @@ class Settings(BaseSettings):
     # --- Observability ---
     langfuse: LangfuseConfig = Field(default_factory=LangfuseConfig)
 
-    @property
+    @cached_property
     def core_tables_list(self) -> list[str]:
         """Parse core_tables string into list."""
         if not self.core_tables:
@@ -505,99 +621,185 @@ class Settings(BaseSettings):
     # Dynamically parsed database configurations
     _databases: dict[str, DatabaseConfig] = {}
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Runtime overrides assign fields after construction; drop lists parsed from them
+        derived = _PARSED_LIST_FIELDS.get(name)
+        if derived is not None:
+            self.__dict__.pop(derived, None)
+
     @model_validator(mode="before")
     @classmethod
     def parse_database_configs(cls, data: dict[str, Any]) -> dict[str, Any]:
         """Parse DB_<NAME>_* environment variables into database configurations."""
-        # Also load from environment if not in data
-        env_data = {k.lower(): v for k, v in os.environ.items()}
-        merged = {**env_data, **{k.lower(): v for k, v in data.items()}}
-
-        # Find all database prefixes (DB_<NAME>_TYPE pattern)
-        db_pattern = re.compile(r"^db_([a-zA-Z0-9_]+)_type$", re.IGNORECASE)
-        db_names = set()
-
-        for key in merged.keys():
-            match = db_pattern.match(key)
-            if match:
-                db_names.add(match.group(1).upper())
-
-        # Parse each database configuration
+        # One pass over DB_* keys, bucketing values by <NAME>; data (e.g. .env values)
+        # overrides the process environment. A key is filed under every suffix it ends
+        # with, so DB_A_SYSTEM_TYPE is both A's system_type and A_SYSTEM's type.
+        buckets: defaultdict[str, dict[str, Any]] = defaultdict(dict)
+        env = _DB_ENV_SNAPSHOT.get()
+        for source in (os.environ if env is None else env, data):
+            for key, value in source.items():
+                # Lowercase only the 3-char prefix of the (mostly unrelated) other keys
+                if key[:3].lower() != "db_":
+                    continue
+                lowered = key.lower()
+                for suffix, arg in _DB_KEY_SUFFIXES:
+                    if lowered.endswith(suffix):
+                        # <NAME> must be non-empty [a-z0-9_]
+                        name = lowered[3 : -len(suffix)]
+                        if name and not name.strip(_DB_NAME_CHARS):
+                            buckets[name][arg] = value
+
+        # A database exists only if DB_<NAME>_TYPE is set
         databases = {}
-        for db_name in db_names:
-            prefix = f"db_{db_name.lower()}_"
+        for name, values in buckets.items():
+            if "db_type" not in values:
+                continue
+            kwargs = {arg: values.get(arg, default) for _, arg, default in _DB_FIELDS}
             try:
-                config = DatabaseConfig(
-                    name=db_name,
-                    db_type=merged.get(f"{prefix}type", ""),
-                    host=merged.get(f"{prefix}host", "localhost"),
-                    port=int(merged.get(f"{prefix}port", 3306)),
-                    user=merged.get(f"{prefix}user", "root"),
-                    password=merged.get(f"{prefix}password", ""),
-                    database=merged.get(f"{prefix}database", ""),
-                    schema=merged.get(f"{prefix}schema"),
-                    system_type=merged.get(f"{prefix}system_type", "UNKNOWN"),
-                    description=merged.get(f"{prefix}description", ""),
-                )
-                databases[db_name.lower()] = config
+                kwargs["port"] = int(kwargs["port"])
+                databases[name] = DatabaseConfig(name=name.upper(), **kwargs)
             except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse database config {db_name}: {e}")
+                _log().warning(f"Failed to parse database config {name.upper()}: {e}")
 
         # Store in a special key for later retrieval
         data["_parsed_databases"] = databases
         return data
 
+    @classmethod
+    def construct_trusted(cls, values: dict[str, Any]) -> "Settings":
+        """Build Settings from already-validated values, skipping validation.
+
+        values must come from a validated instance (see _trusted_settings_values);
+        raw environment strings are not coerced or checked here.
+        """
+        values = deepcopy(values)
+        for name, model in (
+            ("llm", LLMConfig),
+            ("checkpointer", CheckpointerConfig),
+            ("langfuse", LangfuseConfig),
+        ):
+            if name in values:
+                values[name] = model.model_construct(**values[name])
+        return cls.model_construct(**values)
+
     @property
     def databases(self) -> dict[str, DatabaseConfig]:
-        """Get all configured database connections."""
-        return getattr(self, "_parsed_databases", {})
+        """Get all configured database connections, keyed by lowercased name."""
+        # Read the extras dict directly; getattr would first miss on the instance
+        # and go through BaseModel.__getattr__ on every access.
+        extra = self.__pydantic_extra__
+        databases = extra.get("_parsed_databases") if extra else None
+        return databases if databases is not None else {}
 
     @field_validator("embedding_provider")
     @classmethod
     def validate_embedding_provider(cls, v: str) -> str:
-        valid_providers = {"local", "openai_api", "tei"}
-        if v.lower() not in valid_providers:
-            raise ValueError(f"EMBEDDING_PROVIDER must be one of {valid_providers}")
+        if v.lower() not in _VALID_EMBEDDING_PROVIDERS:
+            raise ValueError(f"EMBEDDING_PROVIDER must be one of {set(_VALID_EMBEDDING_PROVIDERS)}")
         return v.lower()
 
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         upper_v = v.upper()
-        if upper_v not in valid_levels:
-            raise ValueError(f"LOG_LEVEL must be one of {valid_levels}")
+        if upper_v not in _VALID_LOG_LEVELS:
+            raise ValueError(f"LOG_LEVEL must be one of {set(_VALID_LOG_LEVELS)}")
         return upper_v
 
     @field_validator("session_backend")
     @classmethod
     def validate_session_backend(cls, v: str) -> str:
-        valid_backends = {"postgres"}
-        if v.lower() not in valid_backends:
-            raise ValueError(f"SESSION_BACKEND must be one of {valid_backends}")
+        if v.lower() not in _VALID_SESSION_BACKENDS:
+            raise ValueError(f"SESSION_BACKEND must be one of {set(_VALID_SESSION_BACKENDS)}")
         return v.lower()
 
 
-@lru_cache
+# Settings field -> cached_property parsed from it
+_PARSED_LIST_FIELDS = {
+    "core_tables": "core_tables_list",
+    "code_context_supported_languages": "code_context_languages_list",
+}
+
+
+@lru_cache(maxsize=1)
+def _trusted_settings_values() -> dict[str, Any]:
+    """Validate the environment once and keep the resulting field values."""
+    settings = Settings()
+    values: dict[str, Any] = {name: getattr(settings, name) for name in Settings.model_fields}
+    for name in ("llm", "checkpointer", "langfuse"):
+        values[name] = values[name].model_dump()
+    values.update(settings.__pydantic_extra__ or {})
+    return values
+
+
+def _trust_env() -> bool:
+    return os.environ.get("EASYSQL_TRUST_ENV", "").lower() in {"1", "true", "yes"}
+
+
+@lru_cache(maxsize=1)
+def _db_env() -> dict[str, str]:
+    """Snapshot the DB_* environment once; only used when the environment is trusted."""
+    return {key.lower(): value for key, value in os.environ.items() if key[:3].lower() == "db_"}
+
+
+_SETTINGS: Settings | None = None
+
+
 def get_settings() -> Settings:
     """
     Get cached application settings.
 
+    The instance is held in a module global rather than behind lru_cache, which
+    keeps the hot path to a single global read. reset_settings() drops it.
+
+    With EASYSQL_TRUST_ENV=1 the environment is validated only once per process;
+    later rebuilds (e.g. after runtime overrides change) reuse those values via
+    Settings.construct_trusted. Leave it unset if the environment can change.
+
     Returns:
         Settings: Application settings instance
     """
-    settings = Settings()
-    with _RUNTIME_OVERRIDES_LOCK:
-        for path, value in _RUNTIME_OVERRIDES.items():
-            _apply_override_path(settings, path, value)
+    global _SETTINGS
+    settings = _SETTINGS
+    if settings is None:
+        settings = (
+            Settings.construct_trusted(_trusted_settings_values()) if _trust_env() else Settings()
+        )
+        with _RUNTIME_OVERRIDES_LOCK:
+            for path, value in _RUNTIME_OVERRIDES.items():
+                _apply_override_path(settings, path, value)
+        _SETTINGS = settings
     return settings
 
 
+def reset_settings() -> None:
+    """Drop the cached settings so the next get_settings() call rebuilds them."""
+    global _SETTINGS
+    _SETTINGS = None
+
+
+@lru_cache(maxsize=8)
+def _load_settings_file(env_file: str, mtime_ns: int) -> Settings:
+    """Build settings for an env file; mtime_ns is part of the key so edits invalidate."""
+    if not _trust_env():
+        # _env_file is handled by BaseSettings __init__
+        return Settings(_env_file=env_file)  # type: ignore
+
+    token = _DB_ENV_SNAPSHOT.set(_db_env())
+    try:
+        return Settings(_env_file=env_file)  # type: ignore
+    finally:
+        _DB_ENV_SNAPSHOT.reset(token)
+
+
 def load_settings(env_file: str | Path | None = None) -> Settings:
     """
     Load settings from a specific .env file.
 
+    Settings for a given file are cached until the file's mtime changes.
+
     Args:
         env_file: Path to .env file (optional)
 
@@ -605,10 +807,13 @@ def load_settings(env_file: str | Path | None = None) -> Settings:
         Settings: Application settings instance
     """
     # Clear cache to ensure fresh settings
-    get_settings.cache_clear()
+    reset_settings()
 
     if env_file:
-        # Use pydantic-settings native _env_file parameter
-        # Note: we ignore type error here because _env_file is handled by BaseSettings __init__
-        return Settings(_env_file=env_file)  # type: ignore
+        path = Path(env_file).resolve()
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        return _load_settings_file(str(path), mtime_ns)
     return get_settings()
@@ -3,13 +3,29 @@ Context Builder for EasySql.
 
 Provides modular context construction for LLM-based Text2SQL.
 Converts schema retrieval results into structured prompts for LLM.
+
+The builder, template and section classes are imported on first access
+(PEP 562), so importing only the models does not load them.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .models import ContextInput, ContextOutput, FewShotExample
 from .base import ContextSection, SectionConfig, SectionContent
-from .builder import ContextBuilder
-from .templates import PromptTemplate
-from .sections import SchemaSection, JoinPathSection, FewShotSection
+
+if TYPE_CHECKING:
+    from .builder import ContextBuilder
+    from .templates import PromptTemplate
+    from .sections import SchemaSection, JoinPathSection, FewShotSection
+
+_LAZY_IMPORTS = {
+    "ContextBuilder": ".builder",
+    "PromptTemplate": ".templates",
+    "SchemaSection": ".sections",
+    "JoinPathSection": ".sections",
+    "FewShotSection": ".sections",
+}
 
 __all__ = [
     # Core classes
@@ -27,3 +43,16 @@ __all__ = [
     "JoinPathSection",
     "FewShotSection",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
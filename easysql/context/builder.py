@@ -4,14 +4,19 @@ Context Builder.
 Orchestrates multiple context sections to build LLM prompts.
 """
 
+from bisect import insort
 from typing import List, Optional, Dict, Any
 
-from .base import ContextSection, SectionConfig
+from .base import ContextSection, SectionConfig, estimate_tokens
 from .models import ContextInput, ContextOutput, SectionContent
 from .templates import PromptTemplate
 from .sections import SchemaSection, JoinPathSection, FewShotSection
 
 
+def _section_priority(entry: tuple[ContextSection, SectionConfig]) -> int:
+    return entry[1].priority
+
+
 class ContextBuilder:
     """
     Context builder - orchestrates multiple sections to build LLM context.
@@ -48,9 +53,25 @@ class ContextBuilder:
             max_total_tokens: Maximum total tokens for the context.
         """
         self._sections: List[tuple[ContextSection, SectionConfig]] = []
-        self._template = template or PromptTemplate.default()
+        self._by_name: Dict[str, ContextSection] = {}
+        self.template = template or PromptTemplate.default()
         self._max_tokens = max_total_tokens
 
+    @property
+    def template(self) -> PromptTemplate:
+        """Prompt template used to render the prompts."""
+        return self._template
+
+    @template.setter
+    def template(self, template: PromptTemplate) -> None:
+        # The system prompt does not depend on the input: render and measure it once
+        self._template = template
+        self._system_prompt = template.render_system()
+        self._system_tokens = estimate_tokens(self._system_prompt)
+        # Static user-prompt framing around the sections and question
+        self._framing_tokens = estimate_tokens(template.render_user(sections=[], question=""))
+        self._separator_tokens = estimate_tokens(template.section_separator)
+
     def add_section(
         self,
         section: ContextSection,
@@ -67,7 +88,9 @@ class ContextBuilder:
             Self for chaining.
         """
         config = config or SectionConfig()
-        self._sections.append((section, config))
+        # Keep sections ordered by priority (stable for equal priorities) so build() need not sort
+        insort(self._sections, (section, config), key=_section_priority)
+        self._reindex()
         return self
 
     def remove_section(self, name: str) -> "ContextBuilder":
@@ -80,7 +103,9 @@ class ContextBuilder:
         Returns:
             Self for chaining.
         """
-        self._sections = [(s, c) for s, c in self._sections if s.name != name]
+        if name in self._by_name:
+            self._sections = [(s, c) for s, c in self._sections if s.name != name]
+            self._reindex()
         return self
 
     def get_section(self, name: str) -> Optional[ContextSection]:
@@ -93,10 +118,13 @@ class ContextBuilder:
         Returns:
             Section instance or None if not found.
         """
+        return self._by_name.get(name)
+
+    def _reindex(self) -> None:
+        """Rebuild the name index; the first section in priority order wins for a name."""
+        self._by_name = {}
         for section, _ in self._sections:
-            if section.name == name:
-                return section
-        return None
+            self._by_name.setdefault(section.name, section)
 
     def build(self, context_input: ContextInput) -> ContextOutput:
         """
@@ -108,14 +136,11 @@ class ContextBuilder:
         Returns:
             ContextOutput with system and user prompts.
         """
-        # Sort sections by priority
-        sorted_sections = sorted(self._sections, key=lambda x: x[1].priority)
-
-        # Render each enabled section
+        # Render each enabled section, in priority order
         rendered_sections: List[SectionContent] = []
         total_tokens = 0
 
-        for section, config in sorted_sections:
+        for section, config in self._sections:
             if not config.enabled:
                 continue
 
@@ -131,17 +156,20 @@ class ContextBuilder:
             total_tokens += content.token_count
 
         # Render prompts
-        system_prompt = self._template.render_system()
+        system_prompt = self._system_prompt
         user_prompt = self._template.render_user(
             sections=rendered_sections,
             question=context_input.question,
         )
 
-        # Estimate total tokens
-        total_tokens += self._estimate_tokens(system_prompt)
-        total_tokens += self._estimate_tokens(user_prompt) - sum(
-            s.token_count for s in rendered_sections
-        )  # Avoid double counting
+        # Estimate total tokens from the parts instead of re-scanning the full user prompt
+        joined_sections = sum(1 for s in rendered_sections if s.content.strip())
+        total_tokens += (
+            self._system_tokens
+            + self._framing_tokens
+            + self._separator_tokens * max(joined_sections - 1, 0)
+            + estimate_tokens(context_input.question)
+        )
 
         return ContextOutput(
             system_prompt=system_prompt,
@@ -160,6 +188,10 @@ class ContextBuilder:
         max_tokens: int,
     ) -> SectionContent:
         """Truncate section content to fit token limit."""
+        # The section already estimated its tokens; no need to measure the text again
+        if content.token_count <= max_tokens:
+            return content
+
         # Simple character-based truncation
         # Estimate chars per token (mixed content)
         chars_per_token = 3
@@ -177,12 +209,6 @@ class ContextBuilder:
             metadata={**content.metadata, "truncated": True},
         )
 
-    def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count for text."""
-        chinese_chars = sum(1 for c in text if "\u4e00" <= c <= "\u9fff")
-        other_chars = len(text) - chinese_chars
-        return int(chinese_chars / 1.5 + other_chars / 4)
-
     @classmethod
     def default(cls, db_type: str | None = None) -> "ContextBuilder":
         """
@@ -83,8 +83,11 @@ def get_db_specific_rules(db_type: str | None) -> str:
     if not db_type:
         return ""
 
-    db_type_lower = db_type.lower()
-    return DB_RULES.get(db_type_lower, "")
+    # DatabaseConfig.db_type is already lowercased, so try it as-is first.
+    rules = DB_RULES.get(db_type)
+    if rules is None:
+        rules = DB_RULES.get(db_type.lower(), "")
+    return rules
 
 
 def get_db_type_from_config(db_name: str | None = None) -> str | None:
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from easysql.retrieval.schema_retrieval import RetrievalResult
 
 
-@dataclass
+@dataclass(slots=True)
 class FewShotExample:
     """
     Few-shot example for in-context learning.
@@ -31,7 +31,7 @@ class FewShotExample:
     tables_used: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextInput:
     """
     Input for context building.
@@ -55,7 +55,7 @@ class ContextInput:
     custom_context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionContent:
     """
     Result of rendering a context section.
@@ -73,7 +73,7 @@ class SectionContent:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextOutput:
     """
     Output of context building.
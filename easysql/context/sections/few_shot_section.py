@@ -7,7 +7,7 @@ This is a placeholder for future implementation.
 
 from typing import List
 
-from ..base import ContextSection
+from ..base import ContextSection, estimate_tokens
 from ..models import ContextInput, SectionContent, FewShotExample
 
 
@@ -102,7 +102,7 @@ class FewShotSection(ContextSection):
         return SectionContent(
             name=self.name,
             content=content,
-            token_count=self.estimate_tokens(content),
+            token_count=estimate_tokens(content),
             metadata={
                 "example_count": len(examples),
             }
@@ -6,7 +6,7 @@ Renders FK join path information for SQL generation guidance.
 
 from typing import List, Dict
 
-from ..base import ContextSection
+from ..base import ContextSection, estimate_tokens
 from ..models import ContextInput, SectionContent
 
 
@@ -81,7 +81,7 @@ class JoinPathSection(ContextSection):
         return SectionContent(
             name=self.name,
             content=content,
-            token_count=self.estimate_tokens(content),
+            token_count=estimate_tokens(content),
             metadata={
                 "join_path_count": len(result.join_paths),
             }
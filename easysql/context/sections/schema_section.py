@@ -6,7 +6,7 @@ Renders complete table schema information for LLM context.
 
 from typing import Literal, Set, List, Dict, Any
 
-from ..base import ContextSection
+from ..base import ContextSection, estimate_tokens
 from ..models import ContextInput, SectionContent
 
 
@@ -122,7 +122,7 @@ class SchemaSection(ContextSection):
         return SectionContent(
             name=self.name,
             content=content,
-            token_count=self.estimate_tokens(content),
+            token_count=estimate_tokens(content),
             metadata={
                 "tables": len(result.tables),
                 "total_columns": sum(len(cols) for cols in result.table_columns.values()),
@@ -137,52 +137,32 @@ class SchemaSection(ContextSection):
         semantic_cols: Set[str],
     ) -> List[str]:
         """Render columns in list format."""
+        include_types = self._include_types
+        include_constraints = self._include_constraints
+        include_descriptions = self._include_descriptions
         lines = []
         
         for col in columns:
-            parts = []
-            
-            # Column name
             col_name = col.get("name", "")
-            full_col_name = f"{table_name}.{col_name}"
             
             # Highlight if semantic
-            if full_col_name in semantic_cols:
-                parts.append(f"**{col_name}**")
-            else:
-                parts.append(col_name)
+            if semantic_cols and f"{table_name}.{col_name}" in semantic_cols:
+                col_name = f"**{col_name}**"
             
-            # Data type
-            if self._include_types:
-                data_type = col.get("data_type", "")
-                if data_type:
-                    parts.append(f": {data_type}")
+            data_type = col.get("data_type", "") if include_types else ""
+            type_text = f": {data_type}" if data_type else ""
             
-            # Constraints
-            if self._include_constraints:
-                constraints = []
-                if col.get("is_pk"):
-                    constraints.append("PK")
-                if col.get("is_fk"):
-                    constraints.append("FK")
-                if col.get("is_unique") and not col.get("is_pk"):
-                    constraints.append("UQ")
-                if col.get("is_indexed") and not col.get("is_pk"):
-                    constraints.append("IDX")
-                
-                if constraints:
-                    parts.append(f" ({', '.join(constraints)})")
+            constraints = _column_constraints(col, with_index=True) if include_constraints else ""
+            constraint_text = f" ({constraints})" if constraints else ""
             
-            # Description
-            if self._include_descriptions:
-                chinese_name = col.get("chinese_name", "")
-                description = col.get("description", "")
-                
-                desc_text = chinese_name or description
-                if desc_text:
-                    parts.append(f" - {desc_text}")
+            desc_text = (
+                col.get("chinese_name", "") or col.get("description", "")
+                if include_descriptions
+                else ""
+            )
+            desc_text = f" - {desc_text}" if desc_text else ""
             
-            lines.append("- " + "".join(parts))
+            lines.append(f"- {col_name}{type_text}{constraint_text}{desc_text}")
         
         return lines
     
@@ -193,54 +173,52 @@ class SchemaSection(ContextSection):
         semantic_cols: Set[str],
     ) -> List[str]:
         """Render columns in table format."""
+        include_types = self._include_types
+        include_constraints = self._include_constraints
+        include_descriptions = self._include_descriptions
         lines = []
         
         # Table header
         headers = ["列名"]
-        if self._include_types:
+        if include_types:
             headers.append("类型")
-        if self._include_descriptions:
+        if include_descriptions:
             headers.append("说明")
-        if self._include_constraints:
+        if include_constraints:
             headers.append("约束")
         
         lines.append("| " + " | ".join(headers) + " |")
         lines.append("|" + "|".join(["------"] * len(headers)) + "|")
         
         for col in columns:
-            row = []
-            
-            # Column name
             col_name = col.get("name", "")
-            full_col_name = f"{table_name}.{col_name}"
-            
-            if full_col_name in semantic_cols:
-                row.append(f"**{col_name}**")
-            else:
-                row.append(col_name)
+            if semantic_cols and f"{table_name}.{col_name}" in semantic_cols:
+                col_name = f"**{col_name}**"
             
-            # Data type
-            if self._include_types:
+            row = [col_name]
+            if include_types:
                 row.append(col.get("data_type", "-"))
-            
-            # Description
-            if self._include_descriptions:
-                chinese_name = col.get("chinese_name", "")
-                description = col.get("description", "")
-                row.append(chinese_name or description or "-")
-            
-            # Constraints
-            if self._include_constraints:
-                constraints = []
-                if col.get("is_pk"):
-                    constraints.append("PK")
-                if col.get("is_fk"):
-                    constraints.append("FK")
-                if col.get("is_unique") and not col.get("is_pk"):
-                    constraints.append("UQ")
-                
-                row.append(", ".join(constraints) if constraints else "-")
+            if include_descriptions:
+                row.append(col.get("chinese_name", "") or col.get("description", "") or "-")
+            if include_constraints:
+                row.append(_column_constraints(col, with_index=False) or "-")
             
             lines.append("| " + " | ".join(row) + " |")
         
         return lines
+
+
+def _column_constraints(col: Dict[str, Any], with_index: bool) -> str:
+    """Comma-separated PK/FK/UQ(/IDX) markers for a column; UQ and IDX are implied by PK."""
+    is_pk = col.get("is_pk")
+    constraints = []
+    if is_pk:
+        constraints.append("PK")
+    if col.get("is_fk"):
+        constraints.append("FK")
+    if not is_pk:
+        if col.get("is_unique"):
+            constraints.append("UQ")
+        if with_index and col.get("is_indexed"):
+            constraints.append("IDX")
+    return ", ".join(constraints)
@@ -4,7 +4,10 @@ Prompt Templates for Context Builder.
 Provides default and customizable prompt templates for Text2SQL.
 """
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
 from typing import List, Optional
 from pathlib import Path
 
@@ -35,6 +38,7 @@ DEFAULT_SYSTEM_PROMPT_BASE = """你是一个专业的 SQL 专家，擅长将自
 - 如果无法生成有效 SQL，输出: -- 缺少必要的表: [表名]"""
 
 
+@lru_cache(maxsize=16)
 def get_default_system_prompt(db_type: str | None = None) -> str:
     """
     Get the default system prompt with database-specific rules.
@@ -65,6 +69,27 @@ DEFAULT_USER_PROMPT_TEMPLATE = """{sections}
 请生成正确的 SQL 查询语句："""
 
 
+# {name} placeholders substituted by PromptTemplate.render_system
+_SYSTEM_VAR_RE = re.compile(r"\{(\w+)\}")
+
+
+@lru_cache(maxsize=32)
+def _compile_template(template: str) -> Optional[tuple[tuple[str, Optional[str]], ...]]:
+    """
+    Pre-parse a str.format template into (literal, field_name) pairs.
+
+    Returns None when the template uses anything beyond plain named fields
+    (positional fields, attribute/index access, conversions or format specs);
+    such templates are rendered with str.format.
+    """
+    compiled = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None and (format_spec or conversion or not field_name.isidentifier()):
+            return None
+        compiled.append((literal, field_name))
+    return tuple(compiled)
+
+
 @dataclass
 class PromptTemplate:
     """
@@ -141,10 +166,14 @@ class PromptTemplate:
         Returns:
             Rendered system prompt.
         """
-        template = self.system_template
-        for key, value in kwargs.items():
-            template = template.replace(f"{{{key}}}", str(value))
-        return template
+        if not kwargs:
+            return self.system_template
+
+        # One pass over the template; unknown placeholders are left as they are
+        return _SYSTEM_VAR_RE.sub(
+            lambda m: str(kwargs[m[1]]) if m[1] in kwargs else m[0],
+            self.system_template,
+        )
 
     def render_user(
         self,
@@ -167,11 +196,19 @@ class PromptTemplate:
         section_contents = [s.content for s in sections if s.content.strip()]
         sections_text = self.section_separator.join(section_contents)
 
-        # Render template
-        result = self.user_template.format(
-            sections=sections_text,
-            question=question,
-            **kwargs,
-        )
-
-        return result
+        # Render template; the parsed form is cached per template string
+        compiled = _compile_template(self.user_template)
+        if compiled is None:
+            return self.user_template.format(
+                sections=sections_text,
+                question=question,
+                **kwargs,
+            )
+
+        values = {"sections": sections_text, "question": question, **kwargs}
+        parts = []
+        for literal, field_name in compiled:
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(format(values[field_name]))
+        return "".join(parts)
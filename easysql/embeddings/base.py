@@ -5,7 +5,13 @@ Defines abstract interfaces for embedding providers, enabling pluggable
 implementations for different backends (local models, API services, etc.).
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class BaseEmbeddingProvider(ABC):
@@ -55,6 +61,70 @@ class BaseEmbeddingProvider(ABC):
         """
         pass
 
+    async def encode_batch_async(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        max_concurrency: int = 8,
+    ) -> list[list[float]]:
+        """
+        Encode multiple texts without blocking the event loop.
+
+        The default runs encode_batch in a worker thread, which suits local
+        models. Remote providers override it to keep up to max_concurrency
+        batch requests in flight.
+
+        Args:
+            texts: List of texts to encode.
+            batch_size: Number of texts per batch (per request for remote providers).
+            max_concurrency: Maximum batches encoded at the same time.
+
+        Returns:
+            List of embedding vectors, one per input text.
+        """
+        return await asyncio.to_thread(self.encode_batch, texts, batch_size)
+
+    async def _encode_chunks_concurrently(
+        self,
+        encode_chunk: Callable[[list[str]], list[list[float]]],
+        texts: list[str],
+        batch_size: int,
+        max_concurrency: int,
+    ) -> list[list[float]]:
+        """Run encode_chunk on batch_size slices in threads, max_concurrency at a time."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def encode(chunk: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await asyncio.to_thread(encode_chunk, chunk)
+
+        results = await asyncio.gather(
+            *(encode(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size))
+        )
+        return [vector for chunk in results for vector in chunk]
+
+    def encode_array(self, texts: list[str], batch_size: int = 32) -> "np.ndarray":
+        """
+        Encode multiple texts into a float32 matrix.
+
+        Prefer this over encode_batch for in-process math (similarity, ranking):
+        a (N, D) float32 array avoids one Python float object per component.
+        The default converts encode_batch output; providers that already hold
+        arrays should override it.
+
+        Args:
+            texts: List of texts to encode.
+            batch_size: Number of texts to process per batch.
+
+        Returns:
+            Array of shape (len(texts), dimension) with dtype float32.
+        """
+        import numpy as np
+
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.asarray(self.encode_batch(texts, batch_size), dtype=np.float32)
+
     @property
     @abstractmethod
     def dimension(self) -> int:
@@ -6,6 +6,7 @@ delegating to the configured provider (local or API-based).
 Maintains backward compatibility with the original EmbeddingService API.
 """
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from easysql.utils.logger import get_logger
@@ -14,6 +15,8 @@ from .base import BaseEmbeddingProvider
 from .factory import EmbeddingProviderFactory
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from easysql.config import Settings
 
 logger = get_logger(__name__)
@@ -102,12 +105,40 @@ class EmbeddingService:
     ) -> list[list[float]]:
         return self._provider.encode_batch(texts, batch_size, show_progress)
 
+    async def encode_batch_async(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        max_concurrency: int = 8,
+    ) -> list[list[float]]:
+        return await self._provider.encode_batch_async(texts, batch_size, max_concurrency)
+
+    def encode_array(self, texts: list[str], batch_size: int = 32) -> "np.ndarray":
+        return self._provider.encode_array(texts, batch_size)
+
+    def iter_encode_batches(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+    ) -> Iterator[tuple[int, list[list[float]]]]:
+        """
+        Encode texts lazily, one batch at a time.
+
+        Yields:
+            (start, embeddings) where embeddings[j] belongs to texts[start + j].
+        """
+        for start in range(0, len(texts), batch_size):
+            yield start, self._provider.encode_batch(texts[start : start + batch_size], batch_size)
+
     def compute_similarity(self, text1: str, text2: str) -> float:
         """Compute cosine similarity between two texts."""
         import numpy as np
 
-        vec1 = np.array(self.encode(text1))
-        vec2 = np.array(self.encode(text2))
+        # Providers map blank text to a zero vector, whose similarity is 0
+        if not text1.strip() or not text2.strip():
+            return 0.0
+
+        vec1, vec2 = self.encode_array([text1, text2])
 
         norm1 = np.linalg.norm(vec1)
         norm2 = np.linalg.norm(vec2)
@@ -101,10 +101,27 @@ class SentenceTransformerProvider(BaseEmbeddingProvider):
         result: list[list[float]] = embeddings.tolist()
         return result
 
+    def encode_array(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        processed_texts = [t if t and t.strip() else " " for t in texts]
+
+        embeddings = self._loaded_model.encode(
+            processed_texts,
+            batch_size=batch_size,
+            normalize_embeddings=self._normalize,
+            show_progress_bar=False,
+        )
+        return np.asarray(embeddings, dtype=np.float32)
+
     def compute_similarity(self, text1: str, text2: str) -> float:
         """Compute cosine similarity between two texts."""
-        vec1 = np.array(self.encode(text1))
-        vec2 = np.array(self.encode(text2))
+        # encode() maps blank text to a zero vector, whose similarity is 0
+        if not text1.strip() or not text2.strip():
+            return 0.0
+
+        vec1, vec2 = self.encode_array([text1, text2])
 
         if self._normalize:
             return float(np.dot(vec1, vec2))
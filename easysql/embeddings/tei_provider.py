@@ -15,6 +15,7 @@ logger = get_logger(__name__)
 
 DEFAULT_TIMEOUT = 60.0
 DEFAULT_BATCH_SIZE = 32
+DEFAULT_MAX_CONCURRENCY = 8
 
 
 class TEIProvider(BaseEmbeddingProvider):
@@ -119,6 +120,22 @@ class TEIProvider(BaseEmbeddingProvider):
 
         return all_results
 
+    async def encode_batch_async(
+        self,
+        texts: list[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[list[float]]:
+        if not texts:
+            return []
+
+        processed_texts = [t if t and t.strip() else " " for t in texts]
+
+        # httpx.Client is thread-safe; requests share its pool and retry logic
+        return await self._encode_chunks_concurrently(
+            self._call_embed_api, processed_texts, batch_size, max_concurrency
+        )
+
     def close(self) -> None:
         if self._client is not None:
             self._client.close()
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from langchain_core.messages import (
@@ -110,6 +111,15 @@ AGENT_SYSTEM_PROMPT_BASE = """你是一个SQL专家。根据用户问题和提
 AGENT_SYSTEM_PROMPT = AGENT_SYSTEM_PROMPT_BASE.format(db_specific_rules="")
 
 
+@lru_cache(maxsize=16)
+def _agent_system_prompt(db_type: str | None) -> str:
+    """Agent prompt with the (static) rules for db_type, formatted once per type."""
+    db_rules = get_db_specific_rules(db_type)
+    if not db_rules:
+        return AGENT_SYSTEM_PROMPT
+    return AGENT_SYSTEM_PROMPT_BASE.format(db_specific_rules=f"\n{db_rules}\n")
+
+
 class SqlAgentNode(BaseNode):
     """SQL Agent Node using tool-calling for iterative SQL generation."""
 
@@ -684,13 +694,9 @@ class SqlAgentNode(BaseNode):
 
         # Get database type and inject specific rules
         db_type = get_db_type_from_config(db_name)
-        db_rules = get_db_specific_rules(db_type)
-
-        if db_rules:
-            agent_prompt = AGENT_SYSTEM_PROMPT_BASE.format(db_specific_rules=f"\n{db_rules}\n")
+        agent_prompt = _agent_system_prompt(db_type)
+        if agent_prompt is not AGENT_SYSTEM_PROMPT:
             logger.debug(f"[SqlAgent] Injected {db_type} specific rules into system prompt")
-        else:
-            agent_prompt = AGENT_SYSTEM_PROMPT
 
         return f"{base_prompt}\n\n{agent_prompt}"
 
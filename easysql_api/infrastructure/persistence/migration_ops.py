@@ -0,0 +1,134 @@
+"""Helpers for Alembic revisions that touch large, live tables."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from alembic import op
+
+# SQLSTATEs worth retrying: serialization_failure, deadlock_detected,
+# lock_not_available (raised when lock_timeout expires)
+_TRANSIENT_SQLSTATES = frozenset({"40001", "40P01", "55P03"})
+
+
+def _is_transient(exc: DBAPIError) -> bool:
+    # asyncpg reports the code as sqlstate, psycopg2 as pgcode
+    code = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+    return code in _TRANSIENT_SQLSTATES
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    *,
+    retries: int = 3,
+    retry_delay: float = 2.0,
+    **kwargs: Any,
+) -> None:
+    """Create an index with CREATE INDEX CONCURRENTLY so writes are not blocked.
+
+    PostgreSQL refuses CONCURRENTLY inside a transaction, so the statement runs
+    in an autocommit block. A failed concurrent build leaves an INVALID index
+    behind; it is dropped before the next attempt. Only lock timeouts,
+    deadlocks and serialization failures are retried; other errors (a missing
+    table, a bad column) are raised immediately.
+
+    Only use this for tables that already hold data. Indexes on tables created
+    in the same revision gain nothing from it and should use op.create_index.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            with op.get_context().autocommit_block():
+                op.create_index(
+                    index_name,
+                    table_name,
+                    list(columns),
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                    **kwargs,
+                )
+            return
+        except DBAPIError as exc:
+            if attempt >= retries or not _is_transient(exc):
+                raise
+            with op.get_context().autocommit_block():
+                op.drop_index(
+                    index_name,
+                    table_name=table_name,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+            time.sleep(retry_delay * attempt)
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index with DROP INDEX CONCURRENTLY outside the migration transaction."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def batch_insert_select(
+    target_table: str,
+    columns: Sequence[str],
+    source_select: str,
+    key_column: str,
+    *,
+    batch_size: int = 1000,
+) -> int:
+    """Copy rows with set-based INSERT ... SELECT statements, batch_size rows at a time.
+
+    Use this for data migrations instead of looping over rows with op.execute.
+    source_select must expose every name in columns plus key_column, and
+    key_column must be unique and orderable. Batches are paged by key
+    (keyset pagination), so each statement only scans its own slice.
+
+    target_table ("table" or "schema.table"), columns and key_column are
+    quoted as identifiers. source_select is embedded as raw SQL and must be
+    a trusted literal written in the revision, never user input.
+
+    Returns:
+        Number of rows copied.
+    """
+    bind = op.get_bind()
+    quote = bind.dialect.identifier_preparer.quote
+    table = ".".join(quote(part) for part in target_table.split("."))
+    cols = ", ".join(quote(column) for column in columns)
+    key = quote(key_column)
+
+    def _batch_stmt(where: str) -> Any:
+        return text(
+            "WITH batch AS ("
+            f"SELECT * FROM ({source_select}) AS src {where} "
+            f"ORDER BY src.{key} LIMIT :limit"
+            f"), ins AS (INSERT INTO {table} ({cols}) SELECT {cols} FROM batch) "
+            f"SELECT max({key}) AS last_key, count(*) AS copied FROM batch"
+        )
+
+    first_stmt = _batch_stmt("")
+    next_stmt = _batch_stmt(f"WHERE src.{key} > :last_key")
+
+    total = 0
+    last_key: Any = None
+    while True:
+        if last_key is None:
+            row = bind.execute(first_stmt, {"limit": batch_size}).one()
+        else:
+            row = bind.execute(next_stmt, {"limit": batch_size, "last_key": last_key}).one()
+        copied = int(row.copied)
+        total += copied
+        if copied < batch_size:
+            return total
+        last_key = row.last_key
@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from collections.abc import Callable, Iterable
 
-from easysql.config import get_settings
+from easysql.config import reset_settings
 from easysql.llm.nodes.retrieve import (
     reset_retrieval_service_cache,
     warm_retrieval_service_cache,
@@ -49,7 +49,7 @@ class CacheInvalidator:
 
     def invalidate(self, tags: Iterable[str]) -> None:
         tag_set = set(tags)
-        get_settings.cache_clear()
+        reset_settings()
 
         if "graph" in tag_set:
             reset_query_service_graph()
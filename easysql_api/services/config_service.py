@@ -10,6 +10,7 @@ from easysql.config import (
     get_settings,
     remove_runtime_overrides,
     replace_runtime_overrides,
+    reset_settings,
     update_runtime_overrides,
 )
 from easysql.utils.logger import get_logger
@@ -61,7 +62,7 @@ class ConfigService:
             overrides[spec.settings_path] = value
 
         replace_runtime_overrides(overrides)
-        get_settings.cache_clear()
+        reset_settings()
 
     async def get_overrides(self) -> dict[str, dict[str, dict[str, Any]]]:
         rows = await self._repository.load_all()
@@ -4,22 +4,13 @@ from easysql_api.services import cache_invalidator as module
 from easysql_api.services.cache_invalidator import CacheInvalidator
 
 
-class DummySettingsGetter:
-    def __init__(self) -> None:
-        self.cleared = 0
-
-    def cache_clear(self) -> None:
-        self.cleared += 1
-
-
 def test_invalidate_dispatches_by_tags(monkeypatch) -> None:
-    settings_getter = DummySettingsGetter()
     called: dict[str, int] = {}
 
     def _mark(name: str):
         called[name] = called.get(name, 0) + 1
 
-    monkeypatch.setattr(module, "get_settings", settings_getter)
+    monkeypatch.setattr(module, "reset_settings", lambda: _mark("settings"))
     monkeypatch.setattr(module, "reset_query_service_graph", lambda: _mark("query_graph"))
     monkeypatch.setattr(module, "reset_query_service_callbacks", lambda: _mark("query_callbacks"))
     monkeypatch.setattr(module, "reset_chart_service_callbacks", lambda: _mark("chart_callbacks"))
@@ -39,7 +30,7 @@ def test_invalidate_dispatches_by_tags(monkeypatch) -> None:
         }
     )
 
-    assert settings_getter.cleared == 1
+    assert called["settings"] == 1
     assert called["query_graph"] == 1
     assert called["query_callbacks"] == 1
     assert called["chart_callbacks"] == 1
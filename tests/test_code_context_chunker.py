@@ -4,7 +4,7 @@ from textwrap import dedent
 
 import pytest
 
-from easysql.code_context.chunker import CodeChunk, CodeChunker, ChunkResult
+from easysql.code_context.chunker import ChunkTable, CodeChunk, CodeChunker, ChunkResult
 from easysql.code_context.utils import FileTracker, LanguageDetector, FileChange
 
 
@@ -48,6 +48,21 @@ class TestCodeChunker:
         assert result.success
         assert len(result.chunks) == 0
 
+    def test_fallback_covers_whole_file(self, tmp_path: Path):
+        chunker = CodeChunker(chunk_size=100, chunk_overlap=20)
+        chunker._splitters = {}
+        chunker._generic_splitter = None
+
+        py_file = tmp_path / "big.py"
+        content = "".join(f"x_{i} = {i}\n" for i in range(60))
+        py_file.write_text(content)
+
+        result = chunker.chunk_file(py_file, "python", "hash")
+
+        assert len(result.chunks) > 1
+        assert [c.chunk_index for c in result.chunks] == list(range(len(result.chunks)))
+        assert result.chunks[-1].content.endswith("x_59 = 59\n")
+
     def test_chunk_id_format(self):
         chunk = CodeChunk(
             content="def foo(): pass",
@@ -59,6 +74,14 @@ class TestCodeChunker:
 
         assert chunk.chunk_id == "src/utils.py:2"
 
+        chunk.relocate("proj/src/utils.py")
+
+        assert chunk.chunk_id == "proj/src/utils.py:2"
+
+        chunk.relocate("proj/src/helpers.py")
+
+        assert chunk.to_embedding_text().startswith("file:helpers\n")
+
     def test_to_embedding_text(self):
         chunk = CodeChunk(
             content="class Order:\n    pass",
@@ -73,6 +96,73 @@ class TestCodeChunker:
         assert "file:order" in text
         assert "class Order:" in text
 
+    def test_chunk_files_parallel_preserves_order(self, tmp_path: Path):
+        files = []
+        for i in range(5):
+            path = tmp_path / f"mod{i}.py"
+            path.write_text(f"def func_{i}():\n    return {i}\n")
+            files.append((path, "python", f"hash{i}"))
+        files.append((tmp_path / "notes.md", "markdown", "skip"))
+
+        serial = CodeChunker(max_workers=1).chunk_files(files)
+        parallel = CodeChunker(max_workers=4).chunk_files(files)
+
+        assert parallel.success
+        assert [c.file_hash for c in parallel.chunks] == [f"hash{i}" for i in range(5)]
+        assert [c.content for c in parallel.chunks] == [c.content for c in serial.chunks]
+
+        errors: list[str] = []
+        streamed = list(CodeChunker(max_workers=2).iter_chunk_files(files, errors=errors))
+
+        assert [c.content for c in streamed] == [c.content for c in serial.chunks]
+        assert errors == []
+
+        processes = CodeChunker(max_workers=2, use_processes=True).chunk_files(files)
+
+        assert [c.content for c in processes.chunks] == [c.content for c in serial.chunks]
+
+    def test_chunk_files_from_bytes_matches_disk(self, tmp_path: Path):
+        source = "def func():\n    return 1\n"
+        path = tmp_path / "mod.py"
+        path.write_text(source)
+
+        chunker = CodeChunker(max_workers=1)
+        from_disk = chunker.chunk_file(path, "python", "hash1")
+        from_bytes = chunker.chunk_files_from_bytes(
+            [("proj/mod.py", "python", "hash1", source.encode())]
+        )
+
+        assert [c.content for c in from_bytes.chunks] == [c.content for c in from_disk.chunks]
+        assert from_bytes.chunks[0].file_path == "proj/mod.py"
+        assert from_bytes.chunks[0].chunk_id == "proj/mod.py:0"
+
+    def test_chunk_table_matches_chunks(self):
+        chunks = [
+            CodeChunk(
+                content=f"line {i}",
+                file_path="models/order.py",
+                file_hash="hash",
+                language="python",
+                chunk_index=i,
+            )
+            for i in range(3)
+        ]
+
+        table = ChunkTable.from_chunks(chunks)
+
+        assert len(table) == 3
+        assert table.chunk_ids == [c.chunk_id for c in chunks]
+        assert table.embedding_texts() == [c.to_embedding_text() for c in chunks]
+
+    def test_unknown_languages_share_generic_splitter(self):
+        chunker = CodeChunker(supported_languages=["python", "kotlin", "scala"])
+
+        generic = chunker._get_splitter("scala")
+
+        assert generic is chunker._get_splitter("kotlin")
+        assert generic is chunker._get_splitter("not-configured")
+        assert chunker._get_splitter("python") is not generic
+
     def test_supported_languages(self):
         chunker = CodeChunker(supported_languages=["python", "java"])
 
@@ -119,6 +209,18 @@ class TestLanguageDetector:
         assert detector.should_process(Path("src/app.min.js")) is False
         assert detector.should_process(Path("src/User.Designer.cs")) is False
 
+    def test_scan_directory_prunes_excluded(self, tmp_path: Path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("x = 1")
+        (tmp_path / "src" / "app.min.js").write_text("x")
+        (tmp_path / "src" / "notes.md").write_text("x")
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "index.js").write_text("x")
+
+        result = LanguageDetector().scan_directory(tmp_path)
+
+        assert result == {"python": [tmp_path / "src" / "app.py"]}
+
 
 class TestFileTracker:
     def test_detect_new_files(self, tmp_path: Path):
@@ -134,6 +236,7 @@ class TestFileTracker:
         assert len(changes.modified) == 0
         assert len(changes.deleted) == 0
         assert changes.has_changes
+        assert changes.hashes["file1.py"] == tracker._compute_hash(file1)
 
     def test_detect_modified_files(self, tmp_path: Path):
         cache_path = tmp_path / "cache.json"
@@ -150,6 +253,33 @@ class TestFileTracker:
 
         assert "file1.py" in changes.modified
 
+    def test_unchanged_stat_skips_rehash(self, tmp_path: Path, monkeypatch):
+        tracker = FileTracker(tmp_path / "cache.json")
+
+        file1 = tmp_path / "file1.py"
+        file1.write_text("content1")
+
+        changes = tracker.detect_changes({"file1.py": file1})
+        tracker.update_cache(changes.hashes)
+
+        def fail(_path):
+            raise AssertionError("unchanged file was rehashed")
+
+        monkeypatch.setattr(tracker, "_compute_hash", fail)
+        changes = tracker.detect_changes({"file1.py": file1})
+
+        assert not changes.has_changes
+
+    def test_detect_changes_from_hashes(self, tmp_path: Path):
+        tracker = FileTracker(tmp_path / "cache.json")
+        tracker.update_cache({"a.py": "h1", "b.py": "h2"})
+
+        changes = tracker.detect_changes_from_hashes({"a.py": "h1", "b.py": "h3", "c.py": "h4"})
+
+        assert changes.added == {"c.py"}
+        assert changes.modified == {"b.py"}
+        assert changes.deleted == set()
+
     def test_detect_deleted_files(self, tmp_path: Path):
         cache_path = tmp_path / "cache.json"
         tracker = FileTracker(cache_path)
@@ -165,6 +295,7 @@ class TestFileTracker:
 
         tracker1 = FileTracker(cache_path)
         tracker1.update_cache({"file.py": "hash123"})
+        tracker1.flush()
 
         tracker2 = FileTracker(cache_path)
 
@@ -0,0 +1,64 @@
+import zipfile
+from pathlib import Path
+
+from easysql.code_context.chunker import CodeChunker
+from easysql.code_context.pipeline.sync_pipeline import CodeSyncPipeline
+from easysql.code_context.utils import FileTracker
+
+
+class FakeMilvusWriter:
+    def __init__(self) -> None:
+        self.chunks: list = []
+
+    def is_empty(self) -> bool:
+        return not self.chunks
+
+    def upsert_chunks(self, chunks, mode="upsert") -> int:
+        self.chunks.extend(chunks)
+        return len(chunks)
+
+    def delete_by_file_paths(self, file_paths) -> int:
+        return 0
+
+
+def _sync_zip(tmp_path: Path, members: dict[str, str]) -> tuple[FakeMilvusWriter, FileTracker]:
+    zip_path = tmp_path / "project.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+
+    writer = FakeMilvusWriter()
+    tracker = FileTracker(tmp_path / "cache.json")
+    pipeline = CodeSyncPipeline(writer, tracker, CodeChunker())  # type: ignore[arg-type]
+
+    result = pipeline._sync_from_zipfile(zip_path, "pid")
+
+    assert result.success
+    return writer, tracker
+
+
+class TestSyncFromZipfile:
+    def test_ignored_top_level_dirs_still_prevent_root_stripping(self, tmp_path: Path):
+        writer, tracker = _sync_zip(
+            tmp_path,
+            {
+                "src/a.py": "def a():\n    return 1\n",
+                "docs/readme.md": "# docs\n",
+                "node_modules/lib/index.js": "module.exports = 1;\n",
+            },
+        )
+
+        assert {chunk.file_path for chunk in writer.chunks} == {"pid/src/a.py"}
+        assert tracker.cached_file_count == 1
+
+    def test_single_top_level_dir_is_project_root(self, tmp_path: Path):
+        writer, _ = _sync_zip(
+            tmp_path,
+            {
+                "repo/src/a.py": "def a():\n    return 1\n",
+                "repo/README.md": "# readme\n",
+                "notes.py": "x = 1\n",
+            },
+        )
+
+        assert {chunk.file_path for chunk in writer.chunks} == {"pid/src/a.py"}
@@ -7,7 +7,12 @@ from typing import Any
 
 import pytest
 
-from easysql.config import get_runtime_overrides, get_settings, replace_runtime_overrides
+from easysql.config import (
+    get_runtime_overrides,
+    get_settings,
+    replace_runtime_overrides,
+    reset_settings,
+)
 from easysql_api.infrastructure.persistence.config_repository import ConfigUpsertItem
 from easysql_api.services.config_service import ConfigService
 
@@ -66,7 +71,7 @@ class FakeInvalidator:
 
     def invalidate(self, tags: set[str]) -> None:
         self.invalidated.append(set(tags))
-        get_settings.cache_clear()
+        reset_settings()
 
     def warmup(self, tags: set[str]) -> None:
         self.warmed.append(set(tags))
@@ -78,7 +83,7 @@ def _run(coro: Any) -> Any:
 
 def _reset_runtime_overrides() -> None:
     replace_runtime_overrides({})
-    get_settings.cache_clear()
+    reset_settings()
 
 
 def test_bootstrap_from_db_loads_runtime_overrides() -> None:
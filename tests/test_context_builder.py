@@ -130,6 +130,49 @@ class TestContextBuilder:
         print(f"\n=== Total Tokens: {output.total_tokens} ===")
 
 
+class TestEstimateTokens:
+    """Test the shared token estimate."""
+
+    def test_counts_cjk_and_other_characters(self):
+        from easysql.context.base import estimate_tokens
+
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcdefgh") == 2
+        assert estimate_tokens("患者信息表的") == 4
+        assert estimate_tokens("患者 id" * 3) == int(6 / 1.5 + 9 / 4)
+
+    def test_long_text_matches_short_text_estimate(self):
+        from easysql.context.base import estimate_tokens
+
+        # Long enough to take the NumPy path when NumPy is installed
+        unit = "患者信息表 patient_id é 𠀀"
+
+        assert estimate_tokens(unit * 200) == int(200 * 5 / 1.5 + 200 * 15 / 4)
+
+
+class TestPromptTemplate:
+    """Test PromptTemplate rendering."""
+
+    def test_render_user_matches_str_format(self):
+        from easysql.context import PromptTemplate
+        from easysql.context.models import SectionContent
+
+        sections = [SectionContent(name="a", content="A"), SectionContent(name="b", content=" ")]
+        for user_template in ("{{x}} {sections}|{question}|{extra}", "{question!r}:{sections:>3}"):
+            template = PromptTemplate(system_template="", user_template=user_template)
+
+            assert template.render_user(sections, "q", extra=1) == user_template.format(
+                sections="A", question="q", extra=1
+            )
+
+    def test_render_system_substitutes_known_placeholders(self):
+        from easysql.context import PromptTemplate
+
+        template = PromptTemplate(system_template="{db} {x} {db} {{y}}", user_template="")
+
+        assert template.render_system(db="mysql", x="{db}") == "mysql {db} mysql {{y}}"
+
+
 class TestSchemaSection:
     """Test SchemaSection class."""
 
@@ -166,6 +209,27 @@ class TestSchemaSection:
         print("\n=== Table Format ===")
         print(content.content)
 
+    def test_column_lines(self):
+        """Test per-column rendering of types, constraints and descriptions."""
+        from easysql.context import SchemaSection
+
+        columns = [
+            {"name": "id", "data_type": "int", "is_pk": True, "is_indexed": True,
+             "chinese_name": "主键"},
+            {"name": "pid", "is_fk": True, "is_unique": True, "is_indexed": True,
+             "description": "ref"},
+        ]
+        section = SchemaSection()
+
+        assert section._render_list_format("t", columns, {"t.pid"}) == [
+            "- id: int (PK) - 主键",
+            "- **pid** (FK, UQ, IDX) - ref",
+        ]
+        assert section._render_table_format("t", columns, set())[2:] == [
+            "| id | int | 主键 | PK |",
+            "| pid | - | ref | FK, UQ |",
+        ]
+
 
 class TestJoinPathSection:
     """Test JoinPathSection class."""
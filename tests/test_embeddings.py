@@ -0,0 +1,58 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from easysql.embeddings import BaseEmbeddingProvider, EmbeddingService
+
+
+class FakeProvider(BaseEmbeddingProvider):
+    def encode(self, text: str) -> list[float]:
+        if not text.strip():
+            return [0.0, 0.0]
+        return [float(len(text)), 1.0]
+
+    def encode_batch(
+        self, texts: list[str], batch_size: int = 32, show_progress: bool = False
+    ) -> list[list[float]]:
+        return [self.encode(text) for text in texts]
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    @property
+    def model_name(self) -> str:
+        return "fake"
+
+
+def test_encode_array_returns_float32_matrix() -> None:
+    provider = FakeProvider()
+
+    vectors = provider.encode_array(["ab", "abc"])
+
+    assert vectors.dtype == np.float32
+    assert vectors.tolist() == [[2.0, 1.0], [3.0, 1.0]]
+    assert provider.encode_array([]).shape == (0, 2)
+
+
+def test_compute_similarity() -> None:
+    service = EmbeddingService(provider=FakeProvider())
+
+    assert service.compute_similarity("ab", "ab") == pytest.approx(1.0)
+    assert service.compute_similarity("ab", "  ") == 0.0
+
+
+def test_encode_batch_async_defaults_to_encode_batch() -> None:
+    vectors = asyncio.run(FakeProvider().encode_batch_async(["ab", " "]))
+
+    assert vectors == [[2.0, 1.0], [0.0, 0.0]]
+
+
+def test_concurrent_chunks_keep_input_order() -> None:
+    provider = FakeProvider()
+    texts = ["a" * n for n in range(1, 8)]
+
+    vectors = asyncio.run(provider._encode_chunks_concurrently(provider.encode_batch, texts, 2, 3))
+
+    assert vectors == provider.encode_batch(texts)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DBAPIError
+
+from easysql_api.infrastructure.persistence import migration_ops
+
+
+class FakePgError(Exception):
+    def __init__(self, sqlstate: str) -> None:
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+class FakeMigrationContext:
+    @contextmanager
+    def autocommit_block(self):
+        yield
+
+
+class FakeOp:
+    def __init__(self, create_errors: list[str] | None = None) -> None:
+        self.create_errors = list(create_errors or [])
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def get_context(self) -> FakeMigrationContext:
+        return FakeMigrationContext()
+
+    def create_index(self, index_name: str, table_name: str, columns: list[str], **kw) -> None:
+        self.calls.append(("create", kw))
+        if self.create_errors:
+            sqlstate = self.create_errors.pop(0)
+            raise DBAPIError("CREATE INDEX", None, FakePgError(sqlstate))
+
+    def drop_index(self, index_name: str, **kw) -> None:
+        self.calls.append(("drop", kw))
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    delays: list[float] = []
+    monkeypatch.setattr(migration_ops.time, "sleep", delays.append)
+    return delays
+
+
+def test_create_index_retries_transient_errors_after_dropping_invalid_index(
+    monkeypatch, sleeps
+) -> None:
+    fake_op = FakeOp(create_errors=["55P03", "40P01"])
+    monkeypatch.setattr(migration_ops, "op", fake_op)
+
+    migration_ops.create_index_concurrently("ix_t_a", "t", ["a"], retry_delay=1.0)
+
+    assert [name for name, _ in fake_op.calls] == ["create", "drop", "create", "drop", "create"]
+    assert all(kw["postgresql_concurrently"] for _, kw in fake_op.calls)
+    assert sleeps == [1.0, 2.0]
+
+
+def test_create_index_raises_permanent_errors_immediately(monkeypatch, sleeps) -> None:
+    fake_op = FakeOp(create_errors=["42P01"])  # undefined_table
+    monkeypatch.setattr(migration_ops, "op", fake_op)
+
+    with pytest.raises(DBAPIError):
+        migration_ops.create_index_concurrently("ix_t_a", "t", ["a"])
+
+    assert [name for name, _ in fake_op.calls] == ["create"]
+    assert sleeps == []
+
+
+def test_create_index_gives_up_after_retries(monkeypatch, sleeps) -> None:
+    fake_op = FakeOp(create_errors=["40001"] * 3)
+    monkeypatch.setattr(migration_ops, "op", fake_op)
+
+    with pytest.raises(DBAPIError):
+        migration_ops.create_index_concurrently("ix_t_a", "t", ["a"], retries=3)
+
+    assert len(sleeps) == 2
+
+
+class FakeResult:
+    def __init__(self, copied: int, last_key: int | None) -> None:
+        self.copied = copied
+        self.last_key = last_key
+
+    def one(self) -> FakeResult:
+        return self
+
+
+class FakeKeysetBind:
+    """Serves a source table with keys 1..rows and records the INSERT batches."""
+
+    dialect = postgresql.dialect()
+
+    def __init__(self, rows: int) -> None:
+        self.keys = list(range(1, rows + 1))
+        self.statements: list[str] = []
+        self.batches: list[list[int]] = []
+
+    def execute(self, stmt: Any, params: dict[str, Any]) -> FakeResult:
+        self.statements.append(str(stmt))
+        last_key = params.get("last_key")
+        batch = [k for k in self.keys if last_key is None or k > last_key][: params["limit"]]
+        self.batches.append(batch)
+        return FakeResult(len(batch), max(batch) if batch else None)
+
+
+class FakeBindOp:
+    def __init__(self, bind: FakeKeysetBind) -> None:
+        self.bind = bind
+
+    def get_bind(self) -> FakeKeysetBind:
+        return self.bind
+
+
+@pytest.mark.parametrize(("rows", "batches"), [(5, [2, 2, 1]), (4, [2, 2, 0]), (0, [0])])
+def test_batch_insert_select_pages_by_key(monkeypatch, rows: int, batches: list[int]) -> None:
+    bind = FakeKeysetBind(rows)
+    monkeypatch.setattr(migration_ops, "op", FakeBindOp(bind))
+
+    copied = migration_ops.batch_insert_select(
+        "archive.Events", ["id", "user"], "SELECT id, user FROM events", "id", batch_size=2
+    )
+
+    assert copied == rows
+    assert [len(batch) for batch in bind.batches] == batches
+    assert sum(bind.batches, []) == list(range(1, rows + 1))
+    assert 'INSERT INTO archive."Events" (id, "user")' in bind.statements[0]
+    assert all("WHERE src.id > :last_key" in sql for sql in bind.statements[1:])
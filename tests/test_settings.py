@@ -0,0 +1,119 @@
+import os
+
+from easysql.config import (
+    LLMConfig,
+    Settings,
+    _db_env,
+    _trusted_settings_values,
+    get_settings,
+    load_settings,
+    reset_settings,
+)
+
+
+def test_construct_trusted_matches_validated_settings(monkeypatch) -> None:
+    monkeypatch.setenv("DB_SALES_TYPE", "MySQL")
+    monkeypatch.setenv("DB_SALES_PORT", "3307")
+    monkeypatch.setenv("LLM_TEMPERATURE", "0.5")
+    _trusted_settings_values.cache_clear()
+
+    validated = Settings()
+    trusted = Settings.construct_trusted(_trusted_settings_values())
+
+    assert trusted.batch_size == validated.batch_size
+    assert trusted.llm.temperature == 0.5
+    assert trusted.checkpointer.backend == validated.checkpointer.backend
+    assert trusted.databases["sales"].db_type == "mysql"
+    assert trusted.databases["sales"].port == 3307
+
+    _trusted_settings_values.cache_clear()
+
+
+def test_trusted_rebuild_returns_independent_copies(monkeypatch) -> None:
+    monkeypatch.setenv("EASYSQL_TRUST_ENV", "1")
+    _trusted_settings_values.cache_clear()
+    reset_settings()
+
+    first = get_settings()
+    first.llm.temperature = 1.5
+    reset_settings()
+    second = get_settings()
+
+    assert second.llm.temperature != 1.5
+    assert second.llm is not first.llm
+
+    _trusted_settings_values.cache_clear()
+    reset_settings()
+
+
+def test_load_settings_caches_until_env_file_changes(tmp_path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("BATCH_SIZE=10\n")
+
+    first = load_settings(env_file)
+    assert load_settings(env_file) is first
+    assert first.batch_size == 10
+
+    env_file.write_text("BATCH_SIZE=20\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_settings(env_file).batch_size == 20
+
+
+def test_llm_resolution_follows_field_updates() -> None:
+    config = LLMConfig(openai_llm_model="gpt-4o")
+
+    assert (config.get_model(), config.get_provider()) == ("gpt-4o", "openai")
+
+    config.anthropic_llm_model = "claude-sonnet"
+    config.anthropic_api_key = "fake-key"
+
+    assert (config.get_model(), config.get_provider()) == ("claude-sonnet", "anthropic")
+
+
+def test_core_tables_list_follows_field_updates() -> None:
+    settings = Settings(core_tables="a, b")
+
+    assert settings.core_tables_list == ["a", "b"]
+    assert settings.core_tables_list is settings.core_tables_list
+
+    settings.core_tables = "c"
+
+    assert settings.core_tables_list == ["c"]
+
+
+def test_nested_configs_are_not_copied() -> None:
+    llm = LLMConfig(openai_llm_model="gpt-4o")
+    settings = Settings(llm=llm)
+
+    assert settings.llm is llm
+    assert settings.llm is settings.llm
+    assert set(Settings.model_fields) >= {"llm", "checkpointer", "langfuse"}
+
+
+def test_trusted_env_file_load_uses_db_env_snapshot(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("EASYSQL_TRUST_ENV", "1")
+    monkeypatch.setenv("DB_SALES_TYPE", "postgresql")
+    env_file = tmp_path / ".env"
+    env_file.write_text("DB_SALES_HOST=db.internal\n")
+    _db_env.cache_clear()
+
+    settings = load_settings(env_file)
+    monkeypatch.setenv("DB_SALES_TYPE", "mysql")
+
+    assert settings.databases["sales"].db_type == "postgresql"
+    assert settings.databases["sales"].host == "db.internal"
+    assert _db_env()["db_sales_type"] == "postgresql"
+
+    _db_env.cache_clear()
+    reset_settings()
+
+
+def test_databases_keyed_by_lowercased_name(monkeypatch) -> None:
+    monkeypatch.setenv("DB_Sales_TYPE", "mysql")
+    settings = Settings()
+
+    assert settings.databases is settings.databases
+    assert settings.databases["sales"].name == "SALES"
+    assert Settings.model_construct().databases == {}